@@ -14,9 +14,233 @@ This approach is FAR more robust than simple amplitude thresholding.
 
 import numpy as np
 from scipy import signal
+from scipy.fft import rfft, rfftfreq
 import sounddevice as sd
 from collections import deque
+from bisect import bisect_left, insort
 import threading
+import math
+
+try:
+    import pyfftw  # Optional: faster FFT with cached plans
+except ImportError:
+    pyfftw = None
+
+try:
+    from numba import njit  # Optional: compiles the per-block kernels
+except ImportError:
+    njit = None
+
+
+def _make_rfft(blocksize, rows=None):
+    """
+    Build a real FFT function for fixed-size blocks.
+    
+    With rows set, the function takes a (k, blocksize) stack of blocks
+    (k <= rows) and transforms every row in one call.
+    
+    With pyfftw installed the transform is planned once (FFTW_MEASURE)
+    and reuses aligned input/output buffers on every call. Otherwise
+    this falls back to scipy.fft.rfft (pocketfft).
+    
+    NOTE: the pyfftw version returns its shared output buffer, so the
+    result is only valid until the next call.
+    """
+    if pyfftw is None:
+        # Small 512/2048-pt transforms: worker threads cost more than they save
+        return rfft
+    
+    shape = blocksize if rows is None else (rows, blocksize)
+    out_shape = blocksize // 2 + 1 if rows is None else (rows, blocksize // 2 + 1)
+    fft_in = pyfftw.empty_aligned(shape, dtype='float32')
+    fft_out = pyfftw.empty_aligned(out_shape, dtype='complex64')
+    plan = pyfftw.FFTW(fft_in, fft_out, axes=(-1,),
+                       flags=('FFTW_MEASURE', 'FFTW_DESTROY_INPUT'),
+                       threads=1)
+    
+    if rows is None:
+        def planned_rfft(frame):
+            np.copyto(fft_in, frame)
+            return plan()
+    else:
+        def planned_rfft(stack):
+            # Partial batches still run the full plan; unused rows are ignored
+            k = len(stack)
+            np.copyto(fft_in[:k], stack)
+            return plan()[:k]
+    
+    return planned_rfft
+
+
+# Number of set bits for every 4-bit decision mask (a tuple so numba
+# can treat it as a constant)
+_POPCOUNT4 = tuple(bin(i).count('1') for i in range(16))
+
+# Decision mask bits
+_RMS_BIT = 0b0001
+_FREQ_BIT = 0b0010
+_CENTROID_BIT = 0b0100
+_ONSET_BIT = 0b1000
+_ONSET_AND_FREQ = _ONSET_BIT | _FREQ_BIT
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _spectral_features(spectrum, freqs, band_lo, band_hi):
+        """
+        Walk the FFT output once and return
+        (total_energy, band_energy, centroid_num, centroid_den)
+        
+        Energies come from the power spectrum; the centroid stays
+        magnitude-weighted, so it takes one sqrt per bin.
+        """
+        total = 0.0
+        band = 0.0
+        cent_num = 0.0
+        cent_den = 0.0
+        for i in range(spectrum.shape[0]):
+            c = spectrum[i]
+            p = c.real * c.real + c.imag * c.imag
+            total += p
+            if band_lo <= i < band_hi:
+                band += p
+            m = math.sqrt(p)
+            cent_num += freqs[i] * m
+            cent_den += m
+        return total, band, cent_num, cent_den
+else:
+    def _spectral_features(spectrum, freqs, band_lo, band_hi):
+        """
+        NumPy fallback for the fused spectral kernel.
+        
+        The complex64 spectrum is viewed as interleaved (re, im) float32
+        pairs (no copy), so energies are plain dot products.
+        """
+        pairs = spectrum.view(spectrum.real.dtype).reshape(-1, 2)
+        power = np.einsum('ij,ij->i', pairs, pairs)
+        magnitude = np.sqrt(power)
+        return (power.sum(), power[band_lo:band_hi].sum(),
+                np.dot(freqs, magnitude), magnitude.sum())
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _biquad_band_energy(sos, frame, zi):
+        """
+        Run frame through the cascaded biquads (transposed direct form II,
+        same as scipy's sosfilt) and return the output energy. zi is
+        updated in place; no output array is built.
+        """
+        energy = 0.0
+        for n in range(frame.shape[0]):
+            x = frame[n]
+            for s in range(sos.shape[0]):
+                y = sos[s, 0] * x + zi[s, 0]
+                zi[s, 0] = sos[s, 1] * x - sos[s, 4] * y + zi[s, 1]
+                zi[s, 1] = sos[s, 2] * x - sos[s, 5] * y
+                x = y
+            energy += x * x
+        return energy
+else:
+    def _biquad_band_energy(sos, frame, zi):
+        """scipy fallback for the biquad band-energy kernel"""
+        band, zi[...] = signal.sosfilt(sos, frame, zi=zi)
+        return np.dot(band, band)
+
+
+def _classify_block(spectrum, freqs, band_lo, band_hi, rms, noise_floor,
+                    onset_strength, onset_threshold, counter, loud_threshold):
+    """
+    Everything after the FFT for one block: spectral features, decision
+    and debounce. Compiled with numba when available.
+    
+    Returns (centroid, counter). centroid is -1.0 for a block with no
+    spectral energy (counter is reset and nothing should be recorded).
+    """
+    # Total energy, energy in target band (voice/claps) and the
+    # centroid sums, all from one pass over the spectrum
+    total_energy, band_energy, cent_num, cent_den = _spectral_features(
+        spectrum, freqs, band_lo, band_hi
+    )
+    
+    if total_energy == 0:
+        return -1.0, 0
+    
+    # Ratio of energy in target band vs total
+    band_ratio = band_energy / total_energy
+    
+    # SPECTRAL CENTROID (where is the energy concentrated?)
+    # High values = higher frequencies (sharp sounds like claps/voice)
+    # Low values = rumbling bass (traffic, hum)
+    centroid = cent_num / cent_den
+    
+    # DECISION LOGIC
+    # Each check sets one bit:
+    # - RMS must be above noise floor + margin
+    # - Energy concentrated in 500-4000 Hz (filters traffic and hum)
+    # - Centroid in voice/clap range (avoid pure bass/rumble)
+    # - Sudden onset (claps/snaps are sudden, ambient noise is gradual)
+    checks = ((rms > noise_floor * 1.5) * _RMS_BIT
+              | (band_ratio > 0.35) * _FREQ_BIT
+              | (800 < centroid < 5000) * _CENTROID_BIT
+              | (onset_strength > onset_threshold) * _ONSET_BIT)
+    
+    # Strong onset + correct frequency = almost certainly intentional,
+    # otherwise need at least 3 out of 4 checks
+    is_loud = ((checks & _ONSET_AND_FREQ) == _ONSET_AND_FREQ
+               or _POPCOUNT4[checks] >= 3)
+    
+    # DEBOUNCE (smooth out false positives)
+    if is_loud:
+        counter += 1
+    else:
+        counter = max(0, counter - 1)
+    
+    return centroid, counter
+
+
+if njit is not None:
+    _classify_block = njit(cache=True, fastmath=True)(_classify_block)
+
+
+class _HistoryRing:
+    """
+    Fixed-size float32 history: a preallocated numpy array plus a write
+    cursor. Appending never allocates; values() returns oldest-first.
+    """
+    __slots__ = ('buf', 'idx', 'count')
+    
+    def __init__(self, size):
+        self.buf = np.zeros(size, dtype=np.float32)
+        self.idx = 0
+        self.count = 0
+    
+    def __len__(self):
+        return self.count
+    
+    def __iter__(self):
+        return iter(self.values().tolist())
+    
+    def append(self, value):
+        """Store value; return the value it overwrote once full, else None"""
+        buf = self.buf
+        size = len(buf)
+        evicted = float(buf[self.idx]) if self.count == size else None
+        buf[self.idx] = value
+        self.idx = (self.idx + 1) % size
+        if self.count < size:
+            self.count += 1
+        return evicted
+    
+    def mean(self):
+        """Mean of the stored values (order-independent, no copy)"""
+        return float(self.buf[:self.count].mean())
+    
+    def values(self):
+        """Stored values, oldest first"""
+        if self.count < len(self.buf):
+            return self.buf[:self.count]
+        return np.roll(self.buf, -self.idx)
 
 
 class AdvancedAudioProcessor:
@@ -41,7 +265,12 @@ class AdvancedAudioProcessor:
         self.blocksize = blocksize
         self.sensitivity = sensitivity
         
-        # Store recent audio frames for analysis
+        # Frames queued together (after a stall) share one batched rFFT
+        self.max_batch = 4
+        self._batch_in = np.empty((self.max_batch, blocksize),
+                                  dtype=np.float32)
+        
+        # Store recent frame energies for onset detection
         self.audio_buffer = deque(maxlen=4)  # ~186ms of audio history
         
         # Frequency analysis settings
@@ -50,47 +279,108 @@ class AdvancedAudioProcessor:
         self.freq_threshold = 0.015  # Minimum energy in target band
         
         # Spectral centroid settings (measures where most energy is)
-        self.centroid_history = deque(maxlen=10)
+        self.centroid_history = _HistoryRing(10)
         self.centroid_threshold = 0.4  # How different from background
         
         # Onset detection (sudden changes)
-        self.onset_history = deque(maxlen=8)
+        self.onset_history = _HistoryRing(8)
         self.onset_threshold = 1.5  # Energy increase multiplier
         
+        # Optional pre-FFT rejection: a block under fft_skip_rms_margin x the
+        # noise floor with no real onset is treated as not loud without an
+        # FFT. Off by default (0): past the noise gate the RMS check already
+        # passes, so frequency + centroid can make a sustained sound loud
+        # with no onset at all; only enable it to trade that for CPU
+        self.fft_skip_rms_margin = 0.0   # x noise floor
+        self.fft_skip_onset = 1.2        # onset strength
+        
         # Noise gate
         self.noise_floor = 0.002
-        self.noise_floor_history = deque(maxlen=100)
+        self.noise_floor_history = _HistoryRing(100)
+        self._noise_floor_sorted = []  # Same window, kept sorted for the quantile
         
         # Smoothing
         self.is_loud_smoothed = False
         self.loud_counter = 0  # Counter for debouncing
         self.loud_threshold = 2  # Need 2+ consecutive frames
         
-        self.loud = False
+        self.loud = False  # Written by the worker thread, read by the game
         self.stream = None
         
+        # Frames handed from the audio callback to the worker thread.
+        # Drop-oldest ring: deque append/popleft are thread-safe, so the
+        # realtime callback never takes a lock.
+        self._ring = deque(maxlen=8)
+        self._frame_ready = threading.Event()
+        
+        # Preallocated frame buffers. A buffer is taken from the free list
+        # by the callback and only goes back once it is dropped from the
+        # ring or its batch has been processed, so it is never overwritten
+        # while queued or in use. At most a full ring plus one batch are
+        # out at once, and the callback needs one more to fill.
+        pool_size = self._ring.maxlen + self.max_batch + 1
+        self._free_frames = deque(np.empty(blocksize, dtype=np.float32)
+                                  for _ in range(pool_size))
+        self._worker = None
+        self._running = False
+        
         # Create frequency bands for FFT analysis
         self._setup_frequency_bands()
     
     def _setup_frequency_bands(self):
         """Pre-calculate frequency band information"""
-        freqs = np.fft.rfftfreq(self.blocksize, 1.0 / self.samplerate)
+        freqs = rfftfreq(self.blocksize, 1.0 / self.samplerate)
+        self._freqs = freqs.astype(np.float32)  # Reused by the centroid every block
         
         # Find indices for our frequency band of interest
         self.freq_band_mask = (freqs >= self.freq_min) & (freqs <= self.freq_max)
         self.freq_band_indices = np.where(self.freq_band_mask)[0]
         
+        # The band is contiguous, so a slice (not fancy indexing) covers it
+        self._band_lo = int(self.freq_band_indices[0])
+        self._band_hi = int(self.freq_band_indices[-1]) + 1
+        
+        # Hann window against spectral leakage (e.g. hum bleeding into the
+        # voice band); applied while copying into the FFT batch, so it
+        # costs no extra pass
+        self._window = signal.windows.hann(self.blocksize, sym=False).astype(np.float32)
+        
+        # FFT plan reused for every batch of blocks
+        self._rfft = _make_rfft(self.blocksize, rows=self.max_batch)
+        
         print(f"[Audio] Frequency band: {self.freq_min}-{self.freq_max} Hz")
         print(f"[Audio] FFT bins in target band: {len(self.freq_band_indices)}")
     
+    def _warm_up_kernels(self):
+        """
+        Run the compiled kernels once on silence, with the argument types
+        the worker uses, so numba compiles (or loads its on-disk cache)
+        before the stream opens rather than on the first loud block.
+        Touches no processing state.
+        """
+        if njit is None:
+            return
+        
+        row = self._batch_in[:1]
+        row.fill(0.0)
+        _classify_block(self._rfft(row)[0], self._freqs, self._band_lo, self._band_hi,
+                        0.0, 0.0, 0.0, float(self.onset_threshold),
+                        0, self.loud_threshold)
+    
     def start(self):
-        """Start the audio stream"""
+        """Start the processing worker and the audio stream"""
+        self._warm_up_kernels()
+        self._running = True
+        self._worker = threading.Thread(target=self._worker_loop, daemon=True)
+        self._worker.start()
+        
         self.stream = sd.InputStream(
             channels=1,
             samplerate=self.samplerate,
             blocksize=self.blocksize,
             callback=self._audio_callback,
-            latency='low'
+            latency='low',
+            dtype='float32'
         )
         self.stream.start()
         print("[Audio] Stream started")
@@ -101,157 +391,179 @@ class AdvancedAudioProcessor:
             self.stream.stop()
             self.stream.close()
             print("[Audio] Stream stopped")
+        
+        self._running = False
+        self._frame_ready.set()
+        if self._worker:
+            self._worker.join(timeout=1.0)
+            self._worker = None
     
     def _audio_callback(self, indata, frames, time, status):
         """Called whenever new audio data is available"""
         if status:
             print(f"[Audio] Warning: {status}")
         
-        # Copy audio data
-        audio_frame = indata[:, 0].copy()
-        self.audio_buffer.append(audio_frame)
-        
-        # Process the audio
-        self._process_audio()
+        # Only copy the block into a pooled buffer and wake the worker -
+        # all analysis happens off the realtime audio thread
+        self._enqueue(indata[:, 0])
+        self._frame_ready.set()
     
-    def _process_audio(self):
-        """Main processing pipeline"""
-        if len(self.audio_buffer) == 0:
-            return
-        
-        # Get most recent frame
-        current_frame = self.audio_buffer[-1]
-        
-        # 1. AMPLITUDE CHECK - Skip if too quiet (noise gate)
-        rms = np.sqrt(np.mean(current_frame ** 2))
-        self.noise_floor_history.append(rms)
-        
-        # Adaptive noise floor
-        noise_floor = np.percentile(self.noise_floor_history, 10)  # Bottom 10%
-        
-        if rms < noise_floor * 1.5:
-            self.loud_counter = 0
-            self.loud = False
-            return
-        
-        # 2. FFT FREQUENCY ANALYSIS
-        fft = np.fft.rfft(current_frame)
-        magnitude = np.abs(fft)
-        
-        # Energy in target frequency band (voice/claps)
-        target_band_energy = np.sum(magnitude[self.freq_band_indices] ** 2)
-        
-        # Total energy
-        total_energy = np.sum(magnitude ** 2)
-        
-        if total_energy == 0:
-            self.loud_counter = 0
-            self.loud = False
-            return
-        
-        # Ratio of energy in target band vs total
-        band_ratio = target_band_energy / total_energy
-        
-        # 3. SPECTRAL CENTROID (where is the energy concentrated?)
-        centroid = self._calculate_spectral_centroid(magnitude)
-        self.centroid_history.append(centroid)
-        
-        # 4. ONSET DETECTION (sudden changes = intentional sound)
-        onset_strength = self._calculate_onset_strength(current_frame)
-        self.onset_history.append(onset_strength)
-        
-        # 5. DECISION LOGIC
-        is_loud = self._make_decision(
-            rms, 
-            noise_floor,
-            band_ratio, 
-            centroid, 
-            onset_strength
-        )
-        
-        # 6. DEBOUNCE (smooth out false positives)
-        if is_loud:
-            self.loud_counter += 1
-        else:
-            self.loud_counter = max(0, self.loud_counter - 1)
-        
-        # Trigger only after consistent detection
-        self.loud = self.loud_counter >= self.loud_threshold
+    def _enqueue(self, samples):
+        """Copy samples into a free buffer and queue it (callback thread)"""
+        ring = self._ring
+        if len(ring) == ring.maxlen:
+            # Drop the oldest queued frame ourselves (rather than letting
+            # the deque discard it) so its buffer returns to the pool
+            try:
+                self._release(ring.popleft())
+            except IndexError:
+                pass  # The worker took it first
+        
+        buf = self._free_frames.popleft()
+        np.copyto(buf, samples)
+        ring.append(buf)
     
-    def _calculate_spectral_centroid(self, magnitude):
-        """
-        Calculate spectral centroid - shows where most frequency energy is
-        High values = higher frequencies (sharp sounds like claps/voice)
-        Low values = rumbling bass (traffic, hum)
-        """
-        freqs = np.fft.rfftfreq(self.blocksize, 1.0 / self.samplerate)
-        
-        # Avoid division by zero
-        if np.sum(magnitude) == 0:
-            return 0
-        
-        centroid = np.sum(freqs * magnitude) / np.sum(magnitude)
-        return centroid
+    def _release(self, buf):
+        """Return a frame buffer to the pool once nothing refers to it"""
+        self._free_frames.append(buf)
     
-    def _calculate_onset_strength(self, frame):
-        """
-        Detect sudden increases in energy (onsets).
-        Intentional sounds have sharp attacks.
-        Ambient noise is gradual.
+    def _worker_loop(self):
+        """Worker thread: process frames as the callback queues them"""
+        while self._running:
+            self._frame_ready.wait(0.1)
+            self._frame_ready.clear()
+            self._process_pending()
+    
+    def _process_pending(self):
+        """Process every queued frame, oldest first, in FFT batches"""
+        ring = self._ring
+        while ring:
+            batch = []
+            while ring and len(batch) < self.max_batch:
+                try:
+                    batch.append(ring.popleft())
+                except IndexError:
+                    break  # The callback dropped it as the oldest frame
+            self._process_audio(batch)
+            for buf in batch:
+                self._release(buf)
+    
+    def _process_audio(self, frames):
         """
-        if len(self.audio_buffer) < 2:
-            return 0
+        Main processing pipeline for a batch of frames (oldest first).
         
-        current_energy = np.sum(frame ** 2)
-        
-        # Compare with previous frame
-        if len(self.audio_buffer) > 1:
-            prev_frame = list(self.audio_buffer)[-2]
-            prev_energy = np.sum(prev_frame ** 2)
+        Noise gating runs per frame first, then every frame that passes
+        the gate goes through one batched rFFT, then the decisions are
+        applied in order so debouncing sees the same sequence as before.
+        """
+        # Bind per-block lookups once per batch
+        audio_buffer = self.audio_buffer
+        update_noise_floor = self._update_noise_floor
+        window = self._window
+        batch_in = self._batch_in
+        skip_rms_margin = self.fft_skip_rms_margin
+        skip_onset = self.fft_skip_onset
+        
+        # Per-frame results: None if gated, else (rms, noise_floor, onset, row)
+        # with row -1 when the FFT was skipped
+        results = []
+        rows = 0
+        
+        for current_frame in frames:
+            # Frame energy is computed once with a dot product and reused
+            # for both RMS and onset detection
+            current_energy = float(np.dot(current_frame, current_frame))
+            audio_buffer.append(current_energy)
+            
+            # 1. AMPLITUDE CHECK - Skip if too quiet (noise gate)
+            rms = math.sqrt(current_energy / len(current_frame))
+            
+            # Adaptive noise floor
+            noise_floor = update_noise_floor(rms)  # Bottom 10%
+            
+            if rms < noise_floor * 1.5:
+                results.append(None)
+                continue
+            
+            # ONSET DETECTION (sudden changes = intentional sound)
+            # Ratio of this frame's energy to the previous one. Intentional
+            # sounds have sharp attacks, ambient noise is gradual.
+            onset_strength = 0.0
+            if len(audio_buffer) > 1:
+                prev_energy = audio_buffer[-2]
+                if prev_energy != 0:
+                    onset_strength = current_energy / (prev_energy + 1e-10)
             
-            if prev_energy == 0:
-                return 0
+            # Barely above the floor and no attack: not worth an FFT (opt-in)
+            if rms < noise_floor * skip_rms_margin and onset_strength < skip_onset:
+                results.append((rms, noise_floor, onset_strength, -1))
+                continue
             
-            # Ratio of current to previous
-            onset_strength = current_energy / (prev_energy + 1e-10)
-            return onset_strength
+            # Window straight into the FFT batch row
+            np.multiply(current_frame, window, out=batch_in[rows])
+            results.append((rms, noise_floor, onset_strength, rows))
+            rows += 1
+        
+        # 2. FFT FREQUENCY ANALYSIS - one call for the whole batch
+        spectra = self._rfft(batch_in[:rows]) if rows else None
+        
+        freqs = self._freqs
+        band_lo = self._band_lo
+        band_hi = self._band_hi
+        onset_threshold = self.onset_threshold
+        loud_threshold = self.loud_threshold
+        centroid_append = self.centroid_history.append
+        onset_append = self.onset_history.append
+        counter = self.loud_counter
+        
+        for result in results:
+            if result is None:
+                counter = 0
+                continue
+            
+            rms, noise_floor, onset_strength, row = result
+            
+            if row < 0:
+                # Rejected before the FFT - counts as a quiet decision
+                counter = max(0, counter - 1)
+                continue
+            
+            # 3-6. FEATURES, DECISION, DEBOUNCE (compiled kernel)
+            centroid, counter = _classify_block(
+                spectra[row], freqs, band_lo, band_hi,
+                rms, noise_floor, onset_strength, onset_threshold,
+                counter, loud_threshold
+            )
+            
+            if centroid >= 0:
+                centroid_append(centroid)
+                onset_append(onset_strength)
         
-        return 0
+        # Trigger only after consistent detection
+        self.loud_counter = counter
+        self.loud = counter >= loud_threshold
     
-    def _make_decision(self, rms, noise_floor, band_ratio, centroid, onset_strength):
-        """
-        Combined decision logic using multiple features
+    def _update_noise_floor(self, rms):
         """
+        Push rms into the noise floor window and return its 10th percentile.
         
-        # 1. RMS check (must be above noise floor + margin)
-        rms_check = rms > (noise_floor * 1.5)
-        
-        # 2. Frequency band check (energy concentrated in 500-4000 Hz)
-        # This filters out rumbling traffic (low freq) and electrical hum
-        freq_check = band_ratio > 0.35
-        
-        # 3. Spectral centroid check (avoid pure bass/rumble)
-        # Voice and claps have centroid in 1000-3000 Hz range
-        centroid_check = (centroid > 800) and (centroid < 5000)
-        
-        # 4. Onset check (sudden attacks indicate intentional sound)
-        # Ambient noise rises gradually, claps/snaps are sudden
-        onset_check = onset_strength > self.onset_threshold
-        
-        # 5. Combine checks with weighted logic
-        # Need at least 3 out of 4 conditions, or strong onset + frequency
-        checks_passed = sum([rms_check, freq_check, centroid_check, onset_check])
-        
-        decision = False
-        
-        if onset_check and freq_check:
-            # Strong onset + correct frequency = almost certainly intentional
-            decision = True
-        elif checks_passed >= 3:
-            # Multiple checks confirm it's intentional sound
-            decision = True
-        
-        return decision
+        A sorted copy of the window is maintained incrementally (bisect
+        insert/remove) so no full sort is needed per block. Interpolates
+        the same way as np.percentile.
+        """
+        ordered = self._noise_floor_sorted
+        
+        # Round to the ring's float32 so evicted values match exactly
+        rms = float(np.float32(rms))
+        evicted = self.noise_floor_history.append(rms)
+        if evicted is not None:
+            del ordered[bisect_left(ordered, evicted)]
+        insort(ordered, rms)
+        
+        pos = 0.1 * (len(ordered) - 1)
+        lo = int(pos)
+        hi = min(lo + 1, len(ordered) - 1)
+        return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
     
     def is_loud(self):
         """Return current loud state (debounced)"""
@@ -274,9 +586,9 @@ class AdvancedAudioProcessor:
         return {
             'is_loud': self.loud,
             'loud_counter': self.loud_counter,
-            'noise_floor': np.mean(list(self.noise_floor_history)) if self.noise_floor_history else 0,
-            'centroid_history': list(self.centroid_history),
-            'onset_history': list(self.onset_history),
+            'noise_floor': self.noise_floor_history.mean() if self.noise_floor_history else 0,
+            'centroid_history': self.centroid_history.values().tolist(),
+            'onset_history': self.onset_history.values().tolist(),
         }
 
 
@@ -284,33 +596,55 @@ class SimplifiedAudioProcessor:
     """
     Simpler alternative if you want less CPU overhead
     Still uses FFT frequency filtering but simpler logic
+    (use_filter=True measures the band with a biquad bandpass instead)
     """
     
     def __init__(self, 
                  samplerate=44100,
-                 blocksize=2048):
+                 blocksize=2048,
+                 use_filter=False):
         
         self.samplerate = samplerate
         self.blocksize = blocksize
+        self.use_filter = use_filter
         self.audio_buffer = None
         self.loud = False
         self.stream = None
         
+        # Voice/clap bandpass as two cascaded biquads, filter state carried
+        # across blocks. Opt-in: with numba it only beats the planned rFFT
+        # for small blocks (~256 samples); at 2048 the rFFT is cheaper
+        self._sos = signal.iirfilter(2, [500, 4000], btype='band', fs=samplerate,
+                                     output='sos').astype(np.float32)
+        self._zi = np.zeros((self._sos.shape[0], 2), dtype=np.float32)
+        
         # Frequency band setup
-        freqs = np.fft.rfftfreq(blocksize, 1.0 / samplerate)
+        freqs = rfftfreq(blocksize, 1.0 / samplerate)
         self.freq_band_mask = (freqs >= 500) & (freqs <= 4000)
         
-        # History for smoothing
-        self.history = deque(maxlen=3)
+        # Contiguous slice bounds - avoids a boolean-mask gather per block
+        band_indices = np.where(self.freq_band_mask)[0]
+        self._band_lo = int(band_indices[0])
+        self._band_hi = int(band_indices[-1]) + 1
+        self._rfft = _make_rfft(blocksize)
+        
+        # Last 3 decisions for smoothing, one bit each (newest = bit 0)
+        self._hist_mask = 0
     
     def start(self):
         """Start audio stream"""
+        if self.use_filter and njit is not None:
+            # Compile the biquad kernel now, not inside the first callback
+            _biquad_band_energy(self._sos, np.zeros(self.blocksize, dtype=np.float32),
+                                np.zeros_like(self._zi))
+        
         self.stream = sd.InputStream(
             channels=1,
             samplerate=self.samplerate,
             blocksize=self.blocksize,
             callback=self._callback,
-            latency='low'
+            latency='low',
+            dtype='float32'
         )
         self.stream.start()
     
@@ -327,13 +661,22 @@ class SimplifiedAudioProcessor:
         
         frame = indata[:, 0]
         
-        # FFT analysis
-        fft = np.fft.rfft(frame)
-        magnitude = np.abs(fft)
-        
-        # Energy in voice/clap frequency range
-        band_energy = np.sum(magnitude[self.freq_band_mask] ** 2)
-        total_energy = np.sum(magnitude ** 2)
+        if self.use_filter:
+            # Time-domain energies (Parseval): bandpassed vs raw signal
+            band_energy = _biquad_band_energy(self._sos, frame, self._zi)
+            total_energy = np.dot(frame, frame)
+        else:
+            # FFT analysis
+            fft = self._rfft(frame)
+            
+            # complex64 viewed as interleaved (re, im) float32 pairs (no copy):
+            # energy of any bin range is then a single dot product
+            pairs = fft.view(fft.real.dtype)
+            band = pairs[2 * self._band_lo:2 * self._band_hi]
+            
+            # Energy in voice/clap frequency range
+            band_energy = np.dot(band, band)
+            total_energy = np.dot(pairs, pairs)
         
         if total_energy == 0:
             is_loud = False
@@ -343,10 +686,10 @@ class SimplifiedAudioProcessor:
             is_loud = ratio > 0.3
         
         # Store in history for debouncing
-        self.history.append(is_loud)
+        self._hist_mask = ((self._hist_mask << 1) | int(is_loud)) & 0b111
         
-        # Require 2+ consecutive frames
-        self.loud = sum(self.history) >= 2
+        # Require 2+ of the last 3 frames
+        self.loud = _POPCOUNT4[self._hist_mask] >= 2
     
     def is_loud(self):
         """Get current state"""
@@ -6,15 +6,32 @@ import sys
 import math
 import json
 import os
+import string
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import List, Tuple, Dict
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    import orjson  # Optional: faster leaderboard (de)serialization
+except ImportError:
+    orjson = None
 
 # ================= INIT =================
+# Mixer settings have to be in place before pygame.init() opens the device;
+# 44.1 kHz mono matches the sound effects so they are not resampled on load
+pygame.mixer.pre_init(frequency=44100, size=-16, channels=1, buffer=512)
 pygame.init()
 pygame.mixer.init()
 
 WIDTH, HEIGHT = 900, 600
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
+# SCALED|DOUBLEBUF lets SDL present through its renderer; vsync is only a
+# request and some drivers refuse it
+try:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+except pygame.error:
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.SCALED | pygame.DOUBLEBUF)
 pygame.display.set_caption(".EXE – Haunted")
 clock = pygame.time.Clock()
 
@@ -43,6 +60,11 @@ ORANGE = (255, 165, 0)
 BONE_WHITE = (245, 245, 220)
 SHADOW_BLACK = (20, 20, 25)
 
+@lru_cache(maxsize=4096)
+def rgba(base, alpha):
+    """Interned (r, g, b, a) color: one shared tuple per base/alpha pair"""
+    return (base[0], base[1], base[2], alpha)
+
 # ================= DIFFICULTY SCALING CONSTANTS =================
 # Easy mode lasts until this score
 DIFFICULTY_START_SCORE = 5
@@ -77,6 +99,9 @@ class GameState(Enum):
 # ================= DIFFICULTY CONFIG =================
 class DifficultyConfig:
     """Complete difficulty configuration"""
+    __slots__ = ('name', 'bird_scale', 'obstacle_speed', 'noise_threshold',
+                 'gravity', 'easy_mode', 'bird_width', 'bird_height', 'bird_dims')
+    
     def __init__(self, name: str, bird_scale: float, obstacle_speed: float, 
                  noise_threshold: float, gravity: float, easy_mode: bool = True):
         self.name = name
@@ -87,13 +112,15 @@ class DifficultyConfig:
         self.easy_mode = easy_mode  # NEW: Whether to apply easy mode at start
         self.bird_width = int(40 * bird_scale)
         self.bird_height = int(30 * bird_scale)
+        self.bird_dims = (self.bird_width, self.bird_height)
     
     def get_bird_dimensions(self) -> Tuple[int, int]:
-        return (self.bird_width, self.bird_height)
+        return self.bird_dims
 
 class DifficultyManager:
     """Manages all difficulty presets"""
-    DIFFICULTIES = {
+    # Read-only view: the presets are shared by every session
+    DIFFICULTIES = MappingProxyType({
         "SLOW": DifficultyConfig(
             name="SLOW",
             bird_scale=0.8,
@@ -126,7 +153,7 @@ class DifficultyManager:
             gravity=0.5,
             easy_mode=False  # NO easy mode - hard from start
         )
-    }
+    })
     
     @classmethod
     def get_config(cls, difficulty_name: str):
@@ -137,7 +164,26 @@ class DifficultyManager:
         return list(cls.DIFFICULTIES.keys())
 
 # ================= DYNAMIC DIFFICULTY CALCULATOR =================
+# Every parameter has hit its clamp well before this score, so scores past
+# the end of the table reuse the last entry
+DIFFICULTY_TABLE_SIZE = 64
+_difficulty_tables = {}
+
 def calculate_difficulty_params(score: int, difficulty_config: DifficultyConfig) -> dict:
+    """
+    Look up difficulty parameters for a score from a per-config table.
+    
+    The formula is pure in (score, config), so each config's table is built
+    once; the returned dict is shared and must not be modified.
+    """
+    table = _difficulty_tables.get(difficulty_config)
+    if table is None:
+        table = [_compute_difficulty_params(s, difficulty_config)
+                 for s in range(DIFFICULTY_TABLE_SIZE)]
+        _difficulty_tables[difficulty_config] = table
+    return table[min(score, DIFFICULTY_TABLE_SIZE - 1)]
+
+def _compute_difficulty_params(score: int, difficulty_config: DifficultyConfig) -> dict:
     """
     Calculate difficulty parameters based on current score and difficulty mode.
     
@@ -228,15 +274,21 @@ class GameSessionManager:
         self.current_player_index = 0
         self.max_attempts_per_player = 3
         self.session_active = False
+        # Indices of players with attempts left, in turn order. Only the
+        # current player (the head) ever completes, so finished players
+        # are always dropped from the front
+        self._active = deque()
     
     def start_new_session(self, max_attempts: int):
         self.players = []
         self.current_player_index = 0
         self.max_attempts_per_player = max_attempts
         self.session_active = True
+        self._active = deque()
     
     def add_player(self, username: str) -> PlayerSession:
         player = PlayerSession(username, self.max_attempts_per_player)
+        self._active.append(len(self.players))
         self.players.append(player)
         return player
     
@@ -245,6 +297,11 @@ class GameSessionManager:
             return self.players[self.current_player_index]
         return None
     
+    def _drop_finished(self):
+        active = self._active
+        while active and self.players[active[0]].is_complete:
+            active.popleft()
+    
     def move_to_next_player(self) -> bool:
         """Move to next player with attempts left"""
         if not self.players:
@@ -255,24 +312,18 @@ class GameSessionManager:
         if current and not current.is_complete:
             return True
         
-        # Find next player with attempts
-        start_idx = self.current_player_index
-        while True:
-            self.current_player_index = (self.current_player_index + 1) % len(self.players)
-            
-            if self.current_player_index == start_idx:
-                # Looped back - check if anyone has attempts
-                if all(p.is_complete for p in self.players):
-                    self.session_active = False
-                    return False
-            
-            if not self.players[self.current_player_index].is_complete:
-                return True
+        # Next player with attempts is the first one still queued
+        self._drop_finished()
+        if not self._active:
+            self.session_active = False
+            return False
         
-        return False
+        self.current_player_index = self._active[0]
+        return True
     
     def all_players_finished(self) -> bool:
-        return all(p.is_complete for p in self.players) if self.players else False
+        self._drop_finished()
+        return bool(self.players) and not self._active
     
     def get_session_leaderboard(self) -> List[Dict]:
         leaderboard = []
@@ -295,17 +346,26 @@ class LeaderboardManager:
     def load_scores(self):
         if os.path.exists(self.filename):
             try:
-                with open(self.filename, 'r') as f:
-                    return json.load(f)
+                with open(self.filename, 'rb') as f:
+                    data = f.read()
+                return orjson.loads(data) if orjson else json.loads(data)
             except:
                 return []
         return []
     
     def save_scores(self):
-        with open(self.filename, 'w') as f:
-            json.dump(self.scores, f)
+        data = orjson.dumps(self.scores) if orjson else json.dumps(self.scores).encode()
+        # Write then rename so a crash mid-save never truncates the file
+        tmp_name = self.filename + ".tmp"
+        with open(tmp_name, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_name, self.filename)
     
     def add_score(self, username, score, difficulty):
+        # Scores stay sorted in memory; one that doesn't beat the current
+        # 10th place would be cut anyway, so skip the disk write
+        if len(self.scores) >= 10 and score <= self.scores[-1]['score']:
+            return
         self.scores.append({
             'username': username,
             'score': score,
@@ -321,13 +381,47 @@ class LeaderboardManager:
 class HorrorFontRenderer:
     """Creates horror-style text effects without external fonts"""
     
-    @staticmethod
-    def create_horror_text(text: str, size: int, color, style='dripping'):
+    # Rendered surfaces keyed by (text, size, color, style), least recently
+    # used evicted past CACHE_SIZE; 'shaky' keeps a few pre-rendered jitter
+    # frames and cycles through them, one per tick() of the game loop
+    SHAKY_FRAMES = 6
+    CACHE_SIZE = 256
+    _cache = OrderedDict()
+    _shaky_tick = 0
+    
+    @classmethod
+    def create_horror_text(cls, text: str, size: int, color, style='dripping'):
         """
-        Create horror-styled text with effects
+        Create horror-styled text with effects (cached per text/size/color/style)
         Styles: 'dripping', 'jagged', 'shaky', 'cracked'
         """
-        base_font = pygame.font.Font(None, size)
+        key = (text, size, tuple(color), style)
+        cached = cls._cache.get(key)
+        if cached is None:
+            count = cls.SHAKY_FRAMES if style == 'shaky' else 1
+            cached = [cls._render_horror_text(text, size, color, style)
+                      for _ in range(count)]
+            cls._cache[key] = cached
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        
+        if len(cached) == 1:
+            return cached[0]
+        return cached[cls._shaky_tick % len(cached)]
+    
+    @classmethod
+    def tick(cls):
+        """Advance the 'shaky' jitter by one animation step"""
+        cls._shaky_tick += 1
+    
+    @staticmethod
+    def _render_horror_text(text: str, size: int, color, style):
+        """Rasterize one horror-styled text surface"""
+        # Shared font objects: loading the default font per render (six
+        # times for a 'shaky' entry) is the bulk of a cache miss
+        base_font = UITheme.get_font(size)
         base_surf = base_font.render(text, True, color)
         w, h = base_surf.get_size()
         
@@ -348,7 +442,7 @@ class HorrorFontRenderer:
                     # Draw dripping effect
                     for dy in range(drip_length):
                         alpha = int(255 * (1 - dy / drip_length))
-                        drip_color = (*color[:3], alpha)
+                        drip_color = rgba(tuple(color), alpha)
                         width = max(1, 3 - dy // 7)
                         pygame.draw.circle(effect_surf, drip_color, 
                                          (drip_x, drip_y + dy), width)
@@ -379,7 +473,7 @@ class HorrorFontRenderer:
                 pygame.draw.line(effect_surf, SHADOW_BLACK, 
                                (x1 + 10, y1 + 10), (x2 + 10, y2 + 10), 2)
         
-        return effect_surf
+        return effect_surf.convert_alpha()
 
 # ================= UI THEME =================
 class UITheme:
@@ -394,13 +488,34 @@ class UITheme:
     _fonts = {}
     _horror_renderer = HorrorFontRenderer()
     
+    # Plain text surfaces keyed by (text, size, color), LRU like the horror cache
+    TEXT_CACHE_SIZE = 256
+    _text_cache = OrderedDict()
+    
     @classmethod
     def get_font(cls, size: int, bold: bool = False):
         key = (size, bold)
         if key not in cls._fonts:
-            cls._fonts[key] = pygame.font.Font(None, size)
+            font = pygame.font.Font(None, size)
+            # The default font has no bold face; pygame emboldens it
+            font.set_bold(bold)
+            cls._fonts[key] = font
         return cls._fonts[key]
     
+    @classmethod
+    def render_text(cls, text: str, size: int, color):
+        """Rendered plain text surface, cached per (text, size, color)"""
+        key = (text, size, tuple(color))
+        surf = cls._text_cache.get(key)
+        if surf is None:
+            surf = cls.get_font(size).render(text, True, color).convert_alpha()
+            cls._text_cache[key] = surf
+            if len(cls._text_cache) > cls.TEXT_CACHE_SIZE:
+                cls._text_cache.popitem(last=False)
+        else:
+            cls._text_cache.move_to_end(key)
+        return surf
+    
     @classmethod
     def draw_text(cls, screen, text: str, x: int, y: int, 
                   size: int = 32, color=None, center: bool = True, 
@@ -419,8 +534,7 @@ class UITheme:
             else:
                 rect = surf.get_rect(topleft=(x, y))
         else:
-            font = cls.get_font(size)
-            surf = font.render(text, True, color)
+            surf = cls.render_text(text, size, color)
             if center:
                 rect = surf.get_rect(center=(x, y))
             else:
@@ -447,44 +561,61 @@ class PixelatedRenderer:
                 for py in range(0, int(height), block_size):
                     if py >= local_height:
                         rect = pygame.Rect(x + px, py, block_size, block_size)
-                        pygame.draw.rect(screen, color, rect)
+                        screen.fill(color, rect)
                         pygame.draw.rect(screen, outline_color, rect, 1)
             else:
                 local_height = height + (peak_heights[pattern_idx] * block_size)
                 for py in range(int(height), HEIGHT, block_size):
                     if py <= local_height:
                         rect = pygame.Rect(x + px, py, block_size, block_size)
-                        pygame.draw.rect(screen, color, rect)
+                        screen.fill(color, rect)
                         pygame.draw.rect(screen, outline_color, rect, 1)
 
 # ================= HORROR ATMOSPHERE =================
-class FogParticle:
-    """Slow-moving fog particles for atmospheric horror"""
-    def __init__(self):
-        self.reset()
+class FogSystem:
+    """
+    Slow-moving fog particles for atmospheric horror.
     
-    def reset(self):
-        self.x = random.randint(-50, WIDTH + 50)
-        self.y = random.randint(0, HEIGHT)
-        self.size = random.randint(60, 150)
-        self.speed = random.uniform(0.1, 0.3)
-        self.opacity = random.randint(10, 30)
+    Stored as parallel arrays (one per field) so the whole layer moves in
+    a single vectorized step per frame.
+    """
+    def __init__(self, count):
+        self.x = np.array([random.randint(-50, WIDTH + 50) for _ in range(count)], dtype=np.float32)
+        self.y = np.array([random.randint(0, HEIGHT) for _ in range(count)], dtype=np.float32)
+        self.size = np.array([random.randint(60, 150) for _ in range(count)], dtype=np.float32)
+        self.speed = np.array([random.uniform(0.1, 0.3) for _ in range(count)], dtype=np.float32)
+        self.opacity = [random.randint(10, 30) for _ in range(count)]
+        self._half = [int(size) // 2 for size in self.size]
+        
+        # Size and opacity are fixed per particle, so render each puff once
+        self._surfs = []
+        for size, half, opacity in zip(self.size.tolist(), self._half, self.opacity):
+            surf = pygame.Surface((int(size), int(size)), pygame.SRCALPHA)
+            pygame.draw.circle(surf, rgba(FOG_GRAY, opacity), (half, half), half)
+            self._surfs.append(surf.convert_alpha())
     
     def update(self):
-        self.x -= self.speed
-        if self.x < -self.size:
-            self.x = WIDTH + 50
-            self.y = random.randint(0, HEIGHT)
+        np.subtract(self.x, self.speed, out=self.x)
+        wrapped = np.flatnonzero(self.x < -self.size)
+        if wrapped.size:
+            self.x[wrapped] = WIDTH + 50
+            for i in wrapped:
+                self.y[i] = random.randint(0, HEIGHT)
     
     def draw(self):
-        fog_surface = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(fog_surface, (*FOG_GRAY, self.opacity), 
-                          (self.size // 2, self.size // 2), self.size // 2)
-        screen.blit(fog_surface, (int(self.x - self.size // 2), int(self.y - self.size // 2)))
+        # One blits() call for the whole layer instead of a blit per puff
+        screen.blits([(surf, (int(x - half), int(y - half)))
+                      for surf, half, x, y in zip(self._surfs, self._half,
+                                                  self.x.tolist(), self.y.tolist())],
+                     False)
 
 
 class Bat:
     """Flying bats in background"""
+    # A bat's look depends only on its size and wing position, so each
+    # (size, wing_offset) pair is drawn once and blitted from then on
+    _sprites = {}
+    
     def __init__(self):
         self.reset()
     
@@ -501,29 +632,52 @@ class Bat:
         if self.x < -50:
             self.reset()
     
-    def draw(self):
-        wing_offset = int(math.sin(self.wing_flap) * 4)
+    @staticmethod
+    def _render_sprite(size, wing_offset):
+        """Bat centred at (pad, pad); pad leaves room for the 3px outlines"""
+        pad = size + 6
+        surf = pygame.Surface((pad * 2, pad * 2), pygame.SRCALPHA)
         
         # Draw outline first
-        pygame.draw.circle(screen, BLACK, (int(self.x), int(self.y)), self.size // 2 + 2)
+        pygame.draw.circle(surf, BLACK, (pad, pad), size // 2 + 2)
         
-        left_wing = [(int(self.x - self.size), int(self.y - wing_offset)),
-                     (int(self.x - self.size // 2), int(self.y)),
-                     (int(self.x), int(self.y + wing_offset))]
-        right_wing = [(int(self.x + self.size), int(self.y - wing_offset)),
-                      (int(self.x + self.size // 2), int(self.y)),
-                      (int(self.x), int(self.y + wing_offset))]
+        left_wing = [(pad - size, pad - wing_offset),
+                     (pad - size // 2, pad),
+                     (pad, pad + wing_offset)]
+        right_wing = [(pad + size, pad - wing_offset),
+                      (pad + size // 2, pad),
+                      (pad, pad + wing_offset)]
         
         # Draw wing outlines
-        pygame.draw.polygon(screen, BLACK, left_wing, 3)
-        pygame.draw.polygon(screen, BLACK, right_wing, 3)
+        pygame.draw.polygon(surf, BLACK, left_wing, 3)
+        pygame.draw.polygon(surf, BLACK, right_wing, 3)
         
         # Draw filled wings
-        pygame.draw.circle(screen, (50, 50, 60), (int(self.x), int(self.y)), self.size // 2)
-        pygame.draw.polygon(screen, (50, 50, 60), left_wing)
-        pygame.draw.polygon(screen, (50, 50, 60), right_wing)
+        pygame.draw.circle(surf, (50, 50, 60), (pad, pad), size // 2)
+        pygame.draw.polygon(surf, (50, 50, 60), left_wing)
+        pygame.draw.polygon(surf, (50, 50, 60), right_wing)
+        return surf.convert_alpha(), pad
+    
+    def draw(self):
+        wing_offset = int(math.sin(self.wing_flap) * 4)
+        
+        key = (self.size, wing_offset)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._render_sprite(self.size, wing_offset)
+        surf, pad = sprite
+        screen.blit(surf, (int(self.x) - pad, int(self.y) - pad))
 
 
+# The ghost tail wave repeats every 2*pi of 3 * float_offset; its polygon
+# is precomputed at GHOST_WAVE_PHASES fixed phases
+GHOST_WAVE_PHASES = 32
+_GHOST_WAVE_POINTS = tuple(
+    tuple((i, 50 + math.sin(i * 0.3 + 2 * math.pi * phase / GHOST_WAVE_PHASES) * 3)
+          for i in range(0, 61, 10)) + ((60, 80), (0, 80))
+    for phase in range(GHOST_WAVE_PHASES)
+)
+
 class Ghost:
     """Floating transparent ghosts"""
     def __init__(self):
@@ -535,6 +689,10 @@ class Ghost:
         self.speed = random.uniform(0.5, 1.5)
         self.float_offset = random.uniform(0, math.pi * 2)
         self.opacity = random.randint(30, 70)
+        
+        # Rendered body per wave phase; frames depend on opacity, so each
+        # respawn starts a fresh set
+        self._frames = {}
     
     def update(self):
         self.x -= self.speed
@@ -542,34 +700,30 @@ class Ghost:
         if self.x < -80:
             self.reset()
     
-    def draw(self):
-        float_y = self.y + math.sin(self.float_offset) * 10
+    def _render_frame(self, phase):
         ghost_surface = pygame.Surface((60, 80), pygame.SRCALPHA)
+        points = _GHOST_WAVE_POINTS[phase]
         
         # Draw outline
-        pygame.draw.circle(ghost_surface, (*BLACK, self.opacity + 80), (30, 30), 27)
-        
-        points_outline = []
-        for i in range(0, 61, 10):
-            wave = math.sin((i + self.float_offset * 10) * 0.3) * 3
-            points_outline.append((i, 50 + wave))
-        points_outline.append((60, 80))
-        points_outline.append((0, 80))
-        pygame.draw.polygon(ghost_surface, (*BLACK, self.opacity + 80), points_outline, 3)
+        pygame.draw.circle(ghost_surface, rgba(BLACK, self.opacity + 80), (30, 30), 27)
+        pygame.draw.polygon(ghost_surface, rgba(BLACK, self.opacity + 80), points, 3)
         
         # Draw main ghost
-        pygame.draw.circle(ghost_surface, (*GHOST_WHITE, self.opacity), (30, 30), 25)
+        pygame.draw.circle(ghost_surface, rgba(GHOST_WHITE, self.opacity), (30, 30), 25)
+        pygame.draw.polygon(ghost_surface, rgba(GHOST_WHITE, self.opacity), points)
         
-        points = []
-        for i in range(0, 61, 10):
-            wave = math.sin((i + self.float_offset * 10) * 0.3) * 3
-            points.append((i, 50 + wave))
-        points.append((60, 80))
-        points.append((0, 80))
-        pygame.draw.polygon(ghost_surface, (*GHOST_WHITE, self.opacity), points)
+        pygame.draw.circle(ghost_surface, rgba(BLACK, self.opacity + 50), (20, 25), 4)
+        pygame.draw.circle(ghost_surface, rgba(BLACK, self.opacity + 50), (40, 25), 4)
         
-        pygame.draw.circle(ghost_surface, (*BLACK, self.opacity + 50), (20, 25), 4)
-        pygame.draw.circle(ghost_surface, (*BLACK, self.opacity + 50), (40, 25), 4)
+        return ghost_surface.convert_alpha()
+    
+    def draw(self):
+        float_y = self.y + math.sin(self.float_offset) * 10
+        
+        phase = int(self.float_offset * 3 / (2 * math.pi) * GHOST_WAVE_PHASES) % GHOST_WAVE_PHASES
+        ghost_surface = self._frames.get(phase)
+        if ghost_surface is None:
+            ghost_surface = self._frames[phase] = self._render_frame(phase)
         
         screen.blit(ghost_surface, (int(self.x - 30), int(float_y - 40)))
 
@@ -580,6 +734,13 @@ class LightningFlash:
         self.active = False
         self.timer = 0
         self.next_flash = random.randint(300, 600)
+        
+        # Full-screen overlays for the bright and fading phases, built once
+        self._surfaces = []
+        for alpha in (100, 50):
+            flash_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
+            flash_surface.fill(rgba(GHOST_WHITE, alpha))
+            self._surfaces.append(flash_surface.convert_alpha())
     
     def update(self):
         if self.active:
@@ -595,47 +756,78 @@ class LightningFlash:
     
     def draw(self):
         if self.active:
-            flash_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA)
-            alpha = 100 if self.timer < 5 else 50
-            flash_surface.fill((*GHOST_WHITE, alpha))
-            screen.blit(flash_surface, (0, 0))
+            screen.blit(self._surfaces[0 if self.timer < 5 else 1], (0, 0))
 
 
 class HorrorBackground:
     """Renders haunted forest/graveyard background"""
+    MOON_CENTER = (WIDTH - 150, 100)
+    
     def __init__(self):
         self.moon_glow = 0
-    
-    def draw(self):
-        for y in range(0, HEIGHT, 10):
-            darkness = int(20 + (y / HEIGHT) * 30)
-            color = (darkness, darkness, darkness + 10)
-            pygame.draw.rect(screen, color, (0, y, WIDTH, 10))
         
-        self.moon_glow += 0.02
-        moon_size = 70 + int(math.sin(self.moon_glow) * 5)
-        pygame.draw.circle(screen, MOON_YELLOW, (WIDTH - 150, 100), moon_size)
-        pygame.draw.circle(screen, (200, 200, 150), (WIDTH - 150, 100), moon_size - 10)
+        # Gradient, graves and trees never change: render them once and
+        # only draw the pulsing moon on top each frame
+        self._static_bg = pygame.Surface((WIDTH, HEIGHT))
+        self._render_static(self._static_bg)
+        self._static_bg = self._static_bg.convert()
+        
+        # The pulse only ever gives radii 65..75; one moon sprite per radius
+        self._moon_sprites = {}
+    
+    @staticmethod
+    def _render_moon(moon_size):
+        """Moon of radius moon_size, with its darker face, centred in a square"""
+        surf = pygame.Surface((moon_size * 2 + 2, moon_size * 2 + 2), pygame.SRCALPHA)
+        center = (moon_size + 1, moon_size + 1)
+        pygame.draw.circle(surf, MOON_YELLOW, center, moon_size)
+        pygame.draw.circle(surf, (200, 200, 150), center, moon_size - 10)
+        return surf.convert_alpha()
+    
+    def _render_static(self, surface):
+        # Vertical gradient in 10px bands, built as one (WIDTH, HEIGHT, 3)
+        # array instead of a draw.rect call per band
+        band_y = np.arange(HEIGHT) // 10 * 10
+        darkness = (20 + (band_y / HEIGHT) * 30).astype(np.uint8)
+        column = np.stack([darkness, darkness, darkness + 10], axis=1)
+        pygame.surfarray.blit_array(surface, np.broadcast_to(column, (WIDTH, HEIGHT, 3)))
         
         grave_positions = [100, 280, 460, 640, 820]
         for i, x in enumerate(grave_positions):
             h = 60 + (i % 3) * 20
             # Outline
-            pygame.draw.rect(screen, BLACK, (x - 2, HEIGHT - h - 42, 44, h + 4))
-            pygame.draw.ellipse(screen, BLACK, (x - 7, HEIGHT - h - 64, 54, 44))
+            pygame.draw.rect(surface, BLACK, (x - 2, HEIGHT - h - 42, 44, h + 4))
+            pygame.draw.ellipse(surface, BLACK, (x - 7, HEIGHT - h - 64, 54, 44))
             # Fill
-            pygame.draw.rect(screen, GRAVE_STONE, (x, HEIGHT - h - 40, 40, h))
-            pygame.draw.ellipse(screen, GRAVE_STONE, (x - 5, HEIGHT - h - 60, 50, 40))
+            pygame.draw.rect(surface, GRAVE_STONE, (x, HEIGHT - h - 40, 40, h))
+            pygame.draw.ellipse(surface, GRAVE_STONE, (x - 5, HEIGHT - h - 60, 50, 40))
         
         for i in range(3):
             x = 50 + i * 350
-            self.draw_dead_tree(x, HEIGHT - 150)
+            self.draw_dead_tree(x, HEIGHT - 150, surface)
     
-    def draw_dead_tree(self, x, y):
+    def update(self):
+        self.moon_glow += 0.02
+    
+    def draw(self):
+        screen.blit(self._static_bg, (0, 0))
+        
+        # The moon sits well above the graves and trees, so drawing it last
+        # gives the same picture as the original back-to-front order
+        moon_size = 70 + int(math.sin(self.moon_glow) * 5)
+        moon = self._moon_sprites.get(moon_size)
+        if moon is None:
+            moon = self._moon_sprites[moon_size] = self._render_moon(moon_size)
+        cx, cy = self.MOON_CENTER
+        screen.blit(moon, (cx - moon_size - 1, cy - moon_size - 1))
+    
+    def draw_dead_tree(self, x, y, surface=None):
+        if surface is None:
+            surface = screen
         # Trunk outline
-        pygame.draw.rect(screen, BLACK, (x - 2, y - 2, 24, 154))
+        pygame.draw.rect(surface, BLACK, (x - 2, y - 2, 24, 154))
         # Trunk
-        pygame.draw.rect(screen, DEAD_TREE, (x, y, 20, 150))
+        pygame.draw.rect(surface, DEAD_TREE, (x, y, 20, 150))
         
         branches = [
             ((x + 10, y + 30), (x - 40, y - 20)),
@@ -645,35 +837,80 @@ class HorrorBackground:
         ]
         # Draw branch outlines
         for start, end in branches:
-            pygame.draw.line(screen, BLACK, start, end, 11)
+            pygame.draw.line(surface, BLACK, start, end, 11)
         # Draw branches
         for start, end in branches:
-            pygame.draw.line(screen, DEAD_TREE, start, end, 8)
-
-
-class Star:
-    """Dark atmospheric particles"""
-    def __init__(self):
-        self.reset()
-
-    def reset(self):
-        self.x = random.randint(0, WIDTH)
-        self.y = random.randint(0, HEIGHT)
-        self.size = random.choice([1, 2])
-        self.speed = self.size * 0.2
-        self.color = random.choice([GRAY, DARK_GRAY, FOG_GRAY])
+            pygame.draw.line(surface, DEAD_TREE, start, end, 8)
+
+
+class StarSystem:
+    """Dark atmospheric particles, stored as parallel arrays like FogSystem"""
+    def __init__(self, count):
+        self.x = np.array([random.randint(0, WIDTH) for _ in range(count)], dtype=np.float32)
+        self.y = np.array([random.randint(0, HEIGHT) for _ in range(count)], dtype=np.float32)
+        self.size = [random.choice([1, 2]) for _ in range(count)]
+        self.speed = np.array(self.size, dtype=np.float32) * np.float32(0.2)
+        self.color = [random.choice([GRAY, DARK_GRAY, FOG_GRAY]) for _ in range(count)]
+        
+        # Stars are opaque squares, so each (color, size) becomes a tiny
+        # surface and the layer goes out in one blits() call
+        dots = {}
+        self._surfs = []
+        for color, size in zip(self.color, self.size):
+            dot = dots.get((color, size))
+            if dot is None:
+                dot = pygame.Surface((size, size))
+                dot.fill(color)
+                dot = dots[color, size] = dot.convert()
+            self._surfs.append(dot)
 
     def update(self):
-        self.x -= self.speed
-        if self.x < -10:
-            self.x = WIDTH + 10
-            self.y = random.randint(0, HEIGHT)
+        np.subtract(self.x, self.speed, out=self.x)
+        wrapped = np.flatnonzero(self.x < -10)
+        if wrapped.size:
+            self.x[wrapped] = WIDTH + 10
+            for i in wrapped:
+                self.y[i] = random.randint(0, HEIGHT)
 
     def draw(self):
-        pygame.draw.rect(screen, self.color, (int(self.x), int(self.y), self.size, self.size))
+        screen.blits([(surf, (int(x), int(y)))
+                      for surf, x, y in zip(self._surfs, self.x.tolist(), self.y.tolist())],
+                     False)
 
 # ================= BIRD =================
+def _target_angle_for(vel):
+    if vel < -2:
+        return 60
+    elif vel < 0:
+        return 30
+    elif vel > 2:
+        return -60
+    return -30
+
+# Target tilt per 1/16 velocity bucket over [-8, 8). The ladder thresholds
+# sit on bucket edges, so the ladder is constant inside each bucket (table
+# sampled at midpoints); a velocity exactly on an edge reads the table
+# sampled at the edges, which keeps the strict < and > thresholds exact
+_ANGLE_LUT_SCALE = 16
+_ANGLE_LUT_OFFSET = 8 * _ANGLE_LUT_SCALE
+_ANGLE_LUT = tuple(
+    _target_angle_for((i - _ANGLE_LUT_OFFSET + 0.5) / _ANGLE_LUT_SCALE)
+    for i in range(2 * _ANGLE_LUT_OFFSET)
+)
+_ANGLE_LUT_EDGE = tuple(
+    _target_angle_for((i - _ANGLE_LUT_OFFSET) / _ANGLE_LUT_SCALE)
+    for i in range(2 * _ANGLE_LUT_OFFSET)
+)
+
 class Bird:
+    ROTATION_STEP = 5
+    
+    # Trail dots keyed by (index, trail length); shared by every bird
+    _trail_dots = {}
+    
+    # Decoded sounds keyed by path; a failed load is cached as None
+    _sounds = {}
+    
     def __init__(self, difficulty_config: DifficultyConfig):
         self.config = difficulty_config
         self.x = 150
@@ -692,18 +929,38 @@ class Bird:
                 difficulty_config.get_bird_dimensions()
             )
         except:
-            self.original_img = pygame.Surface(difficulty_config.get_bird_dimensions())
+            self.original_img = pygame.Surface(difficulty_config.get_bird_dimensions()).convert()
             self.original_img.fill(BLOOD_RED)
         
+        # Pre-rotated sprites in ROTATION_STEP degree buckets; the bird size is
+        # fixed once the difficulty is chosen, so rotate once instead of per frame
+        self._rot_cache = {
+            a: pygame.transform.rotate(self.original_img, a)
+            for a in range(-60, 61, self.ROTATION_STEP)
+        }
+        
         self.img = self.original_img
         self.w, self.h = difficulty_config.get_bird_dimensions()
         self.collision_margin = max(4, int(12 - (difficulty_config.bird_scale * 4)))
+        self._collision_rect = pygame.Rect(
+            0, 0,
+            self.w - (self.collision_margin * 2),
+            self.h - (self.collision_margin * 2)
+        )
         
-        self.trail = []
-        try:
-            self.die_sound = pygame.mixer.Sound("sounds/die.mp3")
-        except:
-            self.die_sound = None
+        # Last few centre positions; the deque drops the oldest itself
+        self.trail = deque(maxlen=5)
+        self.die_sound = self._load_sound("sounds/die.mp3")
+    
+    @classmethod
+    def _load_sound(cls, path):
+        # A new Bird is built for every attempt; decode the mp3 only once
+        if path not in cls._sounds:
+            try:
+                cls._sounds[path] = pygame.mixer.Sound(path)
+            except:
+                cls._sounds[path] = None
+        return cls._sounds[path]
 
     def flap(self):
         self.vel = self.lift
@@ -714,14 +971,11 @@ class Bird:
         self.vel = min(self.vel, self.max_fall)
         self.y += self.vel
         
-        if self.vel < -2:
-            self.target_angle = 60
-        elif self.vel < 0:
-            self.target_angle = 30
-        elif self.vel > 2:
-            self.target_angle = -60
-        else:
-            self.target_angle = -30
+        # Scaling by 16 is exact, so scaled == bucket only on a bucket edge
+        scaled = self.vel * _ANGLE_LUT_SCALE
+        bucket = math.floor(scaled)
+        lut = _ANGLE_LUT_EDGE if scaled == bucket else _ANGLE_LUT
+        self.target_angle = lut[min(max(bucket + _ANGLE_LUT_OFFSET, 0), len(lut) - 1)]
         
         angle_diff = self.target_angle - self.angle
         self.angle += angle_diff * 0.2
@@ -732,35 +986,70 @@ class Bird:
             self.vel = 0
         
         self.trail.append((self.x + self.w // 2, self.y + self.h // 2))
-        if len(self.trail) > 5:
-            self.trail.pop(0)
         
-        self.img = pygame.transform.rotate(self.original_img, self.angle)
+        # Physics keeps the float angle; only the displayed sprite is quantized
+        step = self.ROTATION_STEP
+        self.img = self._rot_cache[int(round(self.angle / step)) * step]
 
     def draw(self):
+        trail_len = len(self.trail)
         for i, pos in enumerate(self.trail):
-            alpha = int(150 * (i / len(self.trail)))
             size = 4 - i
-            surf = pygame.Surface((size, size), pygame.SRCALPHA)
-            surf.fill((*BLOOD_RED, alpha))
+            surf = self._trail_dots.get((i, trail_len))
+            if surf is None:
+                alpha = int(150 * (i / trail_len))
+                surf = pygame.Surface((size, size), pygame.SRCALPHA)
+                surf.fill(rgba(BLOOD_RED, alpha))
+                surf = surf.convert_alpha()
+                self._trail_dots[(i, trail_len)] = surf
             screen.blit(surf, (pos[0] - size // 2, pos[1] - size // 2))
         
         rotated_rect = self.img.get_rect(center=(self.x + self.w // 2, self.y + self.h // 2))
         screen.blit(self.img, rotated_rect)
 
     def get_collision_rect(self):
-        return pygame.Rect(
-            self.x + self.collision_margin,
-            self.y + self.collision_margin,
-            self.w - (self.collision_margin * 2),
-            self.h - (self.collision_margin * 2)
-        )
+        """
+        Shared hitbox moved to the bird's current position. Every obstacle
+        checks against it each frame, so reuse one Rect instead of building
+        one per obstacle; callers only read it.
+        """
+        rect = self._collision_rect
+        rect.x = int(self.x + self.collision_margin)
+        rect.y = int(self.y + self.collision_margin)
+        return rect
 
     def hit_ground(self):
         return self.y + self.h >= HEIGHT - 5
 
 # ================= BASE OBSTACLE =================
+@lru_cache(maxsize=1024)
+def ring_offsets(angle_step, radii, turn=0):
+    """(dx, dy, radius) for each block of a blocky ring, truncated with int()
+    exactly as the draws did; turn is the ring's rotation in whole degrees"""
+    offsets = []
+    for angle in range(0, 360, angle_step):
+        rad = math.radians(angle + turn)
+        for radius in radii:
+            offsets.append((int(math.cos(rad) * radius), int(math.sin(rad) * radius), radius))
+    return tuple(offsets)
+
+@lru_cache(maxsize=64)
+def block_sprite(color, size, outline=None):
+    """Opaque size x size block, optionally with a 1px outline; the blocky
+    obstacles blit batches of these instead of one draw.rect per block"""
+    surf = pygame.Surface((size, size))
+    surf.fill(color)
+    if outline is not None:
+        pygame.draw.rect(surf, outline, (0, 0, size, size), 1)
+    return surf.convert()
+
 class Obstacle:
+    # How far left and right of self.x the drawing and hit area can reach
+    # (outlines, sway, sparks); outside that span nothing of the obstacle is
+    # on screen and nothing can collide with it
+    DRAW_REACH_LEFT = 20
+    DRAW_REACH_RIGHT = 100
+    
     def __init__(self, x, speed):
         self.x = x
         self.speed = speed
@@ -770,6 +1059,19 @@ class Obstacle:
         self.x -= self.speed
         return self.x < -150
     
+    def span(self):
+        """Leftmost and rightmost screen x the obstacle can draw or hit at"""
+        return self.x - self.DRAW_REACH_LEFT, self.x + self.DRAW_REACH_RIGHT
+    
+    def visible(self):
+        left, right = self.span()
+        return left < WIDTH and right > 0
+    
+    def near(self, rect):
+        """Whether rect overlaps the span; collide() can only hit if it does"""
+        left, right = self.span()
+        return left < rect.right and right > rect.left
+    
     def passed_bird(self, bird):
         if not self.scored and bird.x > self.x + 100:
             self.scored = True
@@ -791,33 +1093,42 @@ class GravePillarObstacle(Obstacle):
         
         self.crack_pattern = [(random.randint(0, self.width), random.randint(0, 100)) 
                               for _ in range(5)]
+        
+        # The pillar never changes shape, so render it once (cracks can
+        # overhang the right edge by up to 12px) and just blit it
+        self._sprite = pygame.Surface((self.width + 12, HEIGHT), pygame.SRCALPHA)
+        self._render_sprite(self._sprite)
+        self._sprite = self._sprite.convert_alpha()
     
-    def draw(self):
+    def _render_sprite(self, surface):
         block_size = 10
         
         for py in range(0, int(self.height), block_size):
             for px in range(0, self.width, block_size):
-                rect = pygame.Rect(self.x + px, py, block_size, block_size)
-                pygame.draw.rect(screen, GRAVE_STONE, rect)
-                pygame.draw.rect(screen, DARK_GRAY, rect, 1)
+                rect = pygame.Rect(px, py, block_size, block_size)
+                pygame.draw.rect(surface, GRAVE_STONE, rect)
+                pygame.draw.rect(surface, DARK_GRAY, rect, 1)
         
         for crack_x, crack_y in self.crack_pattern:
             if crack_y < self.height:
-                pygame.draw.line(screen, BLACK, 
-                               (self.x + crack_x, crack_y), 
-                               (self.x + crack_x + 10, crack_y + 20), 2)
+                pygame.draw.line(surface, BLACK, 
+                               (crack_x, crack_y), 
+                               (crack_x + 10, crack_y + 20), 2)
         
         bottom_y = self.height + self.gap
         for py in range(int(bottom_y), HEIGHT, block_size):
             for px in range(0, self.width, block_size):
-                rect = pygame.Rect(self.x + px, py, block_size, block_size)
-                pygame.draw.rect(screen, GRAVE_STONE, rect)
-                pygame.draw.rect(screen, DARK_GRAY, rect, 1)
+                rect = pygame.Rect(px, py, block_size, block_size)
+                pygame.draw.rect(surface, GRAVE_STONE, rect)
+                pygame.draw.rect(surface, DARK_GRAY, rect, 1)
         
         for _ in range(3):
-            moss_x = self.x + random.randint(0, self.width - 10)
+            moss_x = random.randint(0, self.width - 10)
             moss_y = random.randint(int(bottom_y), min(int(bottom_y) + 50, HEIGHT - 10))
-            pygame.draw.rect(screen, TOXIC_GREEN, (moss_x, moss_y, 8, 8))
+            pygame.draw.rect(surface, TOXIC_GREEN, (moss_x, moss_y, 8, 8))
+    
+    def draw(self):
+        screen.blit(self._sprite, (int(self.x), 0))
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
@@ -829,6 +1140,9 @@ class GravePillarObstacle(Obstacle):
 # ================= NEW: SKULL TOWER OBSTACLE =================
 class SkullTowerObstacle(Obstacle):
     """Tower of stacked skulls"""
+    SKULL_SIZE = 30
+    _skull_sprite = None  # Shared by every tower, rendered on first use
+    
     def __init__(self, x, speed, score, difficulty_config):
         super().__init__(x, speed)
         self.width = 60
@@ -840,46 +1154,50 @@ class SkullTowerObstacle(Obstacle):
         self.height = random.randint(120, max(120, max_height))
         
         self.skull_wobble = random.uniform(0, math.pi * 2)
+        
+        if SkullTowerObstacle._skull_sprite is None:
+            SkullTowerObstacle._skull_sprite = self._render_skull()
+    
+    @classmethod
+    def _render_skull(cls):
+        """One skull (simplified) with its jaw below; every skull is identical"""
+        skull_size = cls.SKULL_SIZE
+        surf = pygame.Surface((skull_size, skull_size + 5), pygame.SRCALPHA)
+        
+        pygame.draw.ellipse(surf, BONE_WHITE, (0, 0, skull_size, skull_size))
+        pygame.draw.ellipse(surf, BONE_WHITE, (0, 15, skull_size, 20))
+        
+        # Eye sockets
+        pygame.draw.ellipse(surf, BLACK, (7, 8, 8, 10))
+        pygame.draw.ellipse(surf, BLACK, (17, 8, 8, 10))
+        
+        # Glowing red eyes
+        pygame.draw.circle(surf, BLOOD_RED, (11, 12), 3)
+        pygame.draw.circle(surf, BLOOD_RED, (21, 12), 3)
+        return surf.convert_alpha()
     
     def draw(self):
         self.skull_wobble += 0.05
         
+        skull = self._skull_sprite
+        skull_size = self.SKULL_SIZE
+        base_x = self.x + 15
+        wobble = self.skull_wobble
+        
         # Top tower of skulls
-        skull_size = 30
         num_skulls_top = int(self.height / skull_size)
-        
-        for i in range(num_skulls_top):
-            skull_y = i * skull_size
-            skull_x = self.x + 15 + int(math.sin(self.skull_wobble + i) * 3)
-            
-            # Skull (simplified)
-            pygame.draw.ellipse(screen, BONE_WHITE, (skull_x, skull_y, skull_size, skull_size))
-            pygame.draw.ellipse(screen, BONE_WHITE, (skull_x, skull_y + 15, skull_size, 20))
-            
-            # Eye sockets
-            pygame.draw.ellipse(screen, BLACK, (skull_x + 7, skull_y + 8, 8, 10))
-            pygame.draw.ellipse(screen, BLACK, (skull_x + 17, skull_y + 8, 8, 10))
-            
-            # Glowing red eyes
-            pygame.draw.circle(screen, BLOOD_RED, (skull_x + 11, skull_y + 12), 3)
-            pygame.draw.circle(screen, BLOOD_RED, (skull_x + 21, skull_y + 12), 3)
+        skulls = [(skull, (int(base_x + int(math.sin(wobble + i) * 3)), i * skull_size))
+                  for i in range(num_skulls_top)]
         
         # Bottom tower of skulls
         bottom_y = self.height + self.gap
         num_skulls_bottom = int((HEIGHT - bottom_y) / skull_size)
+        skulls += [(skull, (int(base_x + int(math.sin(wobble - i) * 3)), bottom_y + i * skull_size))
+                   for i in range(num_skulls_bottom)]
         
-        for i in range(num_skulls_bottom):
-            skull_y = bottom_y + i * skull_size
-            skull_x = self.x + 15 + int(math.sin(self.skull_wobble - i) * 3)
-            
-            pygame.draw.ellipse(screen, BONE_WHITE, (skull_x, skull_y, skull_size, skull_size))
-            pygame.draw.ellipse(screen, BONE_WHITE, (skull_x, skull_y + 15, skull_size, 20))
-            
-            pygame.draw.ellipse(screen, BLACK, (skull_x + 7, skull_y + 8, 8, 10))
-            pygame.draw.ellipse(screen, BLACK, (skull_x + 17, skull_y + 8, 8, 10))
-            
-            pygame.draw.circle(screen, BLOOD_RED, (skull_x + 11, skull_y + 12), 3)
-            pygame.draw.circle(screen, BLOOD_RED, (skull_x + 21, skull_y + 12), 3)
+        # Later skulls overlap the jaw of the one above, as when drawn in
+        # order; blits() keeps that order
+        screen.blits(skulls, False)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
@@ -891,6 +1209,8 @@ class SkullTowerObstacle(Obstacle):
 # ================= NEW: CREEPING VINES OBSTACLE =================
 class CreepingVinesObstacle(Obstacle):
     """Animated creeping vines that sway"""
+    _segment_sprite = None  # Shared by every vine, rendered on first use
+    
     def __init__(self, x, speed, score, difficulty_config):
         super().__init__(x, speed)
         self.width = 50
@@ -905,25 +1225,48 @@ class CreepingVinesObstacle(Obstacle):
         # Generate thorn positions
         for i in range(0, self.vine_length, 20):
             self.thorns.append((random.randint(-10, 10), i))
+        
+        self._top_segments = range(0, int(self.vine_length), 8)
+        self._sway_phase = None
+        
+        if CreepingVinesObstacle._segment_sprite is None:
+            CreepingVinesObstacle._segment_sprite = self._render_segment()
+    
+    @staticmethod
+    def _render_segment():
+        """One vine segment centred at (7, 7): dark core inside a green ring"""
+        surf = pygame.Surface((14, 14), pygame.SRCALPHA)
+        pygame.draw.circle(surf, TOXIC_GREEN, (7, 7), 6)
+        pygame.draw.circle(surf, (0, 180, 50), (7, 7), 4)
+        return surf.convert_alpha()
+    
+    def _segment_sways(self):
+        """Sway of every top and bottom vine segment at the current offset;
+        draw and collide both need them, so they are computed once per offset"""
+        if self._sway_phase != self.sway_offset:
+            offset = self.sway_offset
+            sin = math.sin
+            self._top_sways = [sin(offset + segment * 0.1) * 15 for segment in self._top_segments]
+            self._bottom_sways = [sin(offset - segment * 0.1) * 15 for segment in range(0, 150, 8)]
+            self._sway_phase = offset
+        return self._top_sways, self._bottom_sways
     
     def draw(self):
         self.sway_offset += 0.03
         
+        top_sways, bottom_sways = self._segment_sways()
+        segment_sprite = self._segment_sprite
+        
         # Top vines hanging down
         base_x = self.x + 25
         
-        for segment in range(0, int(self.vine_length), 8):
-            sway = math.sin(self.sway_offset + segment * 0.1) * 15
-            x_pos = base_x + sway
-            y_pos = segment
-            
-            # Vine segment
-            pygame.draw.circle(screen, TOXIC_GREEN, (int(x_pos), int(y_pos)), 6)
-            pygame.draw.circle(screen, (0, 180, 50), (int(x_pos), int(y_pos)), 4)
+        screen.blits([(segment_sprite, (int(base_x + sway) - 7, segment - 7))
+                      for segment, sway in zip(self._top_segments, top_sways)], False)
         
         # Draw thorns
+        sin, polygon, offset = math.sin, pygame.draw.polygon, self.sway_offset
         for thorn_x, thorn_y in self.thorns:
-            sway = math.sin(self.sway_offset + thorn_y * 0.1) * 15
+            sway = sin(offset + thorn_y * 0.1) * 15
             tx = base_x + sway + thorn_x
             ty = thorn_y
             
@@ -933,26 +1276,26 @@ class CreepingVinesObstacle(Obstacle):
                 (tx - 5, ty + 8),
                 (tx + 5, ty + 8)
             ]
-            pygame.draw.polygon(screen, DARK_RED, thorn_points)
+            polygon(screen, DARK_RED, thorn_points)
         
         # Bottom vines growing up
         bottom_base = HEIGHT - 150
         
-        for segment in range(0, 150, 8):
-            sway = math.sin(self.sway_offset - segment * 0.1) * 15
-            x_pos = base_x + sway
-            y_pos = bottom_base + segment
-            
-            pygame.draw.circle(screen, TOXIC_GREEN, (int(x_pos), int(y_pos)), 6)
-            pygame.draw.circle(screen, (0, 180, 50), (int(x_pos), int(y_pos)), 4)
+        screen.blits([(segment_sprite, (int(base_x + sway) - 7, bottom_base + segment - 7))
+                      for segment, sway in zip(range(0, 150, 8), bottom_sways)], False)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
+        # Sway keeps every segment within 15px of base_x; with int() rounding
+        # the points stay inside [x + 9, x + 41]
+        if collision_rect.right <= self.x + 9 or collision_rect.left > self.x + 41:
+            return False
+        
         base_x = self.x + 25
+        top_sways, bottom_sways = self._segment_sways()
         
         # Check collision with top vines
-        for segment in range(0, int(self.vine_length), 8):
-            sway = math.sin(self.sway_offset + segment * 0.1) * 15
+        for segment, sway in zip(self._top_segments, top_sways):
             x_pos = base_x + sway
             y_pos = segment
             
@@ -961,8 +1304,7 @@ class CreepingVinesObstacle(Obstacle):
         
         # Check collision with bottom vines
         bottom_base = HEIGHT - 150
-        for segment in range(0, 150, 8):
-            sway = math.sin(self.sway_offset - segment * 0.1) * 15
+        for segment, sway in zip(range(0, 150, 8), bottom_sways):
             x_pos = base_x + sway
             y_pos = bottom_base + segment
             
@@ -974,6 +1316,9 @@ class CreepingVinesObstacle(Obstacle):
 # ================= NEW: FLOATING EYEBALL OBSTACLE =================
 class FloatingEyeballObstacle(Obstacle):
     """Giant floating eyeball that tracks the player"""
+    # Every eyeball looks the same; one sprite for open and one for blinking
+    _sprites = {}
+    
     def __init__(self, x, speed, score, difficulty_config):
         super().__init__(x, speed)
         self.width = 80
@@ -985,6 +1330,7 @@ class FloatingEyeballObstacle(Obstacle):
         
         difficulty_params = calculate_difficulty_params(score, difficulty_config)
         self.collision_radius = self.eye_radius + int((250 - difficulty_params['gap']) * 0.08)
+        self._radius_sq = self.collision_radius * self.collision_radius
     
     def update(self):
         result = super().update()
@@ -999,53 +1345,67 @@ class FloatingEyeballObstacle(Obstacle):
         
         return result
     
-    def draw(self):
-        center = (self.x + 40, int(self.eye_y))
-        
-        # Bloodshot veins in the white
-        for _ in range(8):
-            angle = random.uniform(0, 2 * math.pi)
-            vein_end_x = center[0] + math.cos(angle) * (self.eye_radius - 5)
-            vein_end_y = center[1] + math.sin(angle) * (self.eye_radius - 5)
-            pygame.draw.line(screen, BLOOD_RED, center, (vein_end_x, vein_end_y), 1)
+    @staticmethod
+    def _render_sprite(radius, blinking):
+        """Eyeball centred at (pad, pad); pad leaves room for the eyelid arc"""
+        pad = radius + 2
+        surf = pygame.Surface((pad * 2, pad * 2), pygame.SRCALPHA)
+        center = (pad, pad)
         
         # White of eye
-        pygame.draw.circle(screen, GHOST_WHITE, center, self.eye_radius)
+        pygame.draw.circle(surf, GHOST_WHITE, center, radius)
         
-        if not self.is_blinking:
+        if not blinking:
             # Iris (toxic green)
-            pygame.draw.circle(screen, TOXIC_GREEN, center, 20)
+            pygame.draw.circle(surf, TOXIC_GREEN, center, 20)
             
             # Pupil (follows player - tracks left)
             pupil_offset = 8
             pupil_x = center[0] - pupil_offset
             pupil_y = center[1]
-            pygame.draw.circle(screen, BLACK, (pupil_x, pupil_y), 10)
+            pygame.draw.circle(surf, BLACK, (pupil_x, pupil_y), 10)
             
             # Glint
-            pygame.draw.circle(screen, WHITE, (pupil_x + 3, pupil_y - 3), 3)
+            pygame.draw.circle(surf, WHITE, (pupil_x + 3, pupil_y - 3), 3)
         else:
             # Closed eye (horizontal line)
-            pygame.draw.line(screen, DARK_GRAY, 
-                           (center[0] - self.eye_radius, center[1]),
-                           (center[0] + self.eye_radius, center[1]), 3)
+            pygame.draw.line(surf, DARK_GRAY, 
+                           (center[0] - radius, center[1]),
+                           (center[0] + radius, center[1]), 3)
         
         # Eyelids
-        pygame.draw.arc(screen, DARK_GRAY, 
-                       (center[0] - self.eye_radius, center[1] - self.eye_radius,
-                        self.eye_radius * 2, self.eye_radius * 2),
+        pygame.draw.arc(surf, DARK_GRAY, 
+                       (center[0] - radius, center[1] - radius,
+                        radius * 2, radius * 2),
                        0, math.pi, 3)
+        return surf.convert_alpha(), pad
+    
+    def draw(self):
+        key = (self.eye_radius, self.is_blinking)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = self._sprites[key] = self._render_sprite(*key)
+        surf, pad = sprite
+        screen.blit(surf, (int(self.x + 40) - pad, int(self.eye_y) - pad))
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
         center = (self.x + 40, int(self.eye_y))
-        bird_center = (collision_rect.centerx, collision_rect.centery)
-        distance = math.sqrt((bird_center[0] - center[0])**2 + (bird_center[1] - center[1])**2)
-        return distance < self.collision_radius
+        dx = collision_rect.centerx - center[0]
+        # Horizontally out of reach; no need for the distance
+        if abs(dx) >= self.collision_radius:
+            return False
+        dy = collision_rect.centery - center[1]
+        return dx * dx + dy * dy < self._radius_sq
 
 # ================= NEW: PENDULUM AXE OBSTACLE =================
 class PendulumAxeObstacle(Obstacle):
     """Swinging axe pendulum"""
+    # Swung fully, the axe head and handle end ~180px left of x or ~220px
+    # right of it
+    DRAW_REACH_LEFT = 200
+    DRAW_REACH_RIGHT = 240
+    
     def __init__(self, x, speed, score, difficulty_config):
         super().__init__(x, speed)
         self.width = 80
@@ -1057,6 +1417,16 @@ class PendulumAxeObstacle(Obstacle):
         
         difficulty_params = calculate_difficulty_params(score, difficulty_config)
         self.collision_radius = 35 + int((250 - difficulty_params['gap']) * 0.06)
+        self._radius_sq = self.collision_radius * self.collision_radius
+        self._place_axe()
+    
+    def _place_axe(self):
+        """Trig of the current swing and the axe head position; draw and
+        collide both read these, so they are worked out once per update"""
+        self._sin = math.sin(self.angle)
+        self._cos = math.cos(self.angle)
+        self._axe_x = self.x + 40 + self._sin * self.pendulum_length
+        self._axe_y = self.anchor_y + self._cos * self.pendulum_length
     
     def update(self):
         result = super().update()
@@ -1072,14 +1442,13 @@ class PendulumAxeObstacle(Obstacle):
             self.angle = math.copysign(math.pi / 2, self.angle)
             self.angular_velocity *= -0.8
         
+        self._place_axe()
         return result
     
     def draw(self):
         anchor = (self.x + 40, self.anchor_y)
-        
-        # Calculate axe position
-        axe_x = anchor[0] + math.sin(self.angle) * self.pendulum_length
-        axe_y = anchor[1] + math.cos(self.angle) * self.pendulum_length
+        sin_a, cos_a = self._sin, self._cos
+        axe_x, axe_y = self._axe_x, self._axe_y
         
         # Chain/rope
         pygame.draw.line(screen, GRAY, anchor, (int(axe_x), int(axe_y)), 3)
@@ -1088,24 +1457,25 @@ class PendulumAxeObstacle(Obstacle):
         num_links = 8
         for i in range(num_links):
             t = i / num_links
-            link_x = anchor[0] + math.sin(self.angle) * self.pendulum_length * t
-            link_y = anchor[1] + math.cos(self.angle) * self.pendulum_length * t
+            link_x = anchor[0] + sin_a * self.pendulum_length * t
+            link_y = anchor[1] + cos_a * self.pendulum_length * t
             pygame.draw.circle(screen, DARK_GRAY, (int(link_x), int(link_y)), 4)
         
         # Axe head (rotated)
         axe_angle = self.angle + math.pi / 2
+        sin_h, cos_h = math.sin(axe_angle), math.cos(axe_angle)
         
         # Blade
         blade_length = 40
         blade_width = 20
         
         blade_points = [
-            (axe_x - math.cos(axe_angle) * blade_width, 
-             axe_y - math.sin(axe_angle) * blade_width),
-            (axe_x + math.cos(axe_angle) * blade_width,
-             axe_y + math.sin(axe_angle) * blade_width),
-            (axe_x + math.sin(axe_angle) * blade_length,
-             axe_y - math.cos(axe_angle) * blade_length)
+            (axe_x - cos_h * blade_width, 
+             axe_y - sin_h * blade_width),
+            (axe_x + cos_h * blade_width,
+             axe_y + sin_h * blade_width),
+            (axe_x + sin_h * blade_length,
+             axe_y - cos_h * blade_length)
         ]
         
         pygame.draw.polygon(screen, DARK_GRAY, [(int(p[0]), int(p[1])) for p in blade_points])
@@ -1113,21 +1483,16 @@ class PendulumAxeObstacle(Obstacle):
         
         # Handle
         handle_start = (axe_x, axe_y)
-        handle_end = (axe_x - math.sin(axe_angle) * 30,
-                     axe_y + math.cos(axe_angle) * 30)
+        handle_end = (axe_x - sin_h * 30,
+                     axe_y + cos_h * 30)
         pygame.draw.line(screen, DEAD_TREE, handle_start, handle_end, 8)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
         
-        # Axe position
-        anchor = (self.x + 40, self.anchor_y)
-        axe_x = anchor[0] + math.sin(self.angle) * self.pendulum_length
-        axe_y = anchor[1] + math.cos(self.angle) * self.pendulum_length
-        
-        bird_center = (collision_rect.centerx, collision_rect.centery)
-        distance = math.sqrt((bird_center[0] - axe_x)**2 + (bird_center[1] - axe_y)**2)
-        return distance < self.collision_radius
+        dx = collision_rect.centerx - self._axe_x
+        dy = collision_rect.centery - self._axe_y
+        return dx * dx + dy * dy < self._radius_sq
 
 # ================= NEW: COFFIN OBSTACLE =================
 class CoffinObstacle(Obstacle):
@@ -1144,6 +1509,22 @@ class CoffinObstacle(Obstacle):
         
         self.lid_open = 0
         self.lid_direction = 1
+        
+        # Body, border and cross never change; only the lid is drawn live
+        bottom_y = int(self.height + self.gap)
+        self._top_body = self._render_body(int(self.height), int(self.height) - 40)
+        self._bottom_body = self._render_body(HEIGHT - bottom_y, 40)
+    
+    @staticmethod
+    def _render_body(height, cross_y):
+        """One coffin body with its cross centred at cross_y"""
+        surf = pygame.Surface((50, max(height, 1)))
+        pygame.draw.rect(surf, DEAD_TREE, (0, 0, 50, height))
+        pygame.draw.rect(surf, BLACK, (0, 0, 50, height), 2)
+        
+        pygame.draw.line(surf, BONE_WHITE, (20, cross_y - 10), (20, cross_y + 10), 3)
+        pygame.draw.line(surf, BONE_WHITE, (13, cross_y), (27, cross_y), 3)
+        return surf.convert()
     
     def update(self):
         result = super().update()
@@ -1159,41 +1540,18 @@ class CoffinObstacle(Obstacle):
     
     def draw(self):
         coffin_width = 50
-        coffin_x = self.x + 5
-        
-        # Top coffin
-        # Main body
-        pygame.draw.rect(screen, DEAD_TREE, (coffin_x, 0, coffin_width, int(self.height)))
-        pygame.draw.rect(screen, BLACK, (coffin_x, 0, coffin_width, int(self.height)), 2)
-        
-        # Lid (opening)
+        coffin_x = int(self.x + 5)
         lid_offset = int(self.lid_open)
-        pygame.draw.rect(screen, DARK_GRAY, 
-                        (coffin_x - lid_offset, 0, coffin_width, 20))
         
-        # Cross on coffin
-        cross_x = coffin_x + 20
-        cross_y = int(self.height) - 40
-        pygame.draw.line(screen, BONE_WHITE, (cross_x, cross_y - 10), (cross_x, cross_y + 10), 3)
-        pygame.draw.line(screen, BONE_WHITE, (cross_x - 7, cross_y), (cross_x + 7, cross_y), 3)
+        # Top coffin with its lid (opening); the lid stays a draw.rect because
+        # Surface.fill does not clip a rect hanging off the left edge the same way
+        screen.blit(self._top_body, (coffin_x, 0))
+        pygame.draw.rect(screen, DARK_GRAY, (coffin_x - lid_offset, 0, coffin_width, 20))
         
-        # Bottom coffin
-        bottom_y = self.height + self.gap
-        pygame.draw.rect(screen, DEAD_TREE, 
-                        (coffin_x, int(bottom_y), coffin_width, HEIGHT - int(bottom_y)))
-        pygame.draw.rect(screen, BLACK, 
-                        (coffin_x, int(bottom_y), coffin_width, HEIGHT - int(bottom_y)), 2)
-        
-        # Bottom lid
-        pygame.draw.rect(screen, DARK_GRAY, 
-                        (coffin_x - lid_offset, int(bottom_y), coffin_width, 20))
-        
-        # Cross on bottom coffin
-        cross_y_bottom = int(bottom_y) + 40
-        pygame.draw.line(screen, BONE_WHITE, 
-                        (cross_x, cross_y_bottom - 10), (cross_x, cross_y_bottom + 10), 3)
-        pygame.draw.line(screen, BONE_WHITE, 
-                        (cross_x - 7, cross_y_bottom), (cross_x + 7, cross_y_bottom), 3)
+        # Bottom coffin with its lid
+        bottom_y = int(self.height + self.gap)
+        screen.blit(self._bottom_body, (coffin_x, bottom_y))
+        pygame.draw.rect(screen, DARK_GRAY, (coffin_x - lid_offset, bottom_y, coffin_width, 20))
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
@@ -1217,26 +1575,38 @@ class LaserGateObstacle(Obstacle):
         
         self.flash_counter = 0
         self.block_size = 5
-    
-    def draw(self):
-        self.flash_counter += 1
-        flash = (self.flash_counter // 8) % 2 == 0
         
-        emitter_top = pygame.Rect(self.x, self.gate_height - self.laser_thickness // 2 - 20, self.width, 20)
-        emitter_bottom = pygame.Rect(self.x, self.gate_height + self.laser_thickness // 2, self.width, 20)
+        # Emitters are static and the laser only blinks: keep one sprite
+        # without the beam and one with it, both local to the emitter top
+        self._sprite_top = self.gate_height - self.laser_thickness // 2 - 20
+        sprite_h = max(2 * (self.laser_thickness // 2) + 40, self.laser_thickness + 20)
+        self._sprites = []
+        for with_laser in (False, True):
+            sprite = pygame.Surface((self.width, sprite_h), pygame.SRCALPHA)
+            self._render_sprite(sprite, with_laser)
+            self._sprites.append(sprite.convert_alpha())
+    
+    def _render_sprite(self, surface, with_laser):
+        emitter_top = pygame.Rect(0, 0, self.width, 20)
+        emitter_bottom = pygame.Rect(0, 2 * (self.laser_thickness // 2) + 20, self.width, 20)
         
         for rect in [emitter_top, emitter_bottom]:
             for bx in range(0, self.width, self.block_size):
                 for by in range(0, 20, self.block_size):
                     block_rect = pygame.Rect(rect.x + bx, rect.y + by, self.block_size, self.block_size)
-                    pygame.draw.rect(screen, DARK_GRAY, block_rect)
-                    pygame.draw.rect(screen, BLOOD_RED, block_rect, 1)
+                    pygame.draw.rect(surface, DARK_GRAY, block_rect)
+                    pygame.draw.rect(surface, BLOOD_RED, block_rect, 1)
         
-        if flash:
-            laser_rect = pygame.Rect(self.x, self.gate_height - self.laser_thickness // 2, self.width, self.laser_thickness)
-            pygame.draw.rect(screen, BLOOD_RED, laser_rect)
-            inner = pygame.Rect(self.x + 3, laser_rect.y + 3, self.width - 6, self.laser_thickness - 6)
-            pygame.draw.rect(screen, RED, inner)
+        if with_laser:
+            laser_rect = pygame.Rect(0, 20, self.width, self.laser_thickness)
+            pygame.draw.rect(surface, BLOOD_RED, laser_rect)
+            inner = pygame.Rect(3, laser_rect.y + 3, self.width - 6, self.laser_thickness - 6)
+            pygame.draw.rect(surface, RED, inner)
+    
+    def draw(self):
+        self.flash_counter += 1
+        flash = (self.flash_counter // 8) % 2 == 0
+        screen.blit(self._sprites[flash], (int(self.x), self._sprite_top))
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
@@ -1244,16 +1614,22 @@ class LaserGateObstacle(Obstacle):
         return collision_rect.colliderect(laser_rect)
 
 class ElectricCoilObstacle(Obstacle):
+    # Spark dot (surface, radius) per remaining life; shared by every coil
+    _spark_dots = {}
+    
     def __init__(self, x, speed, score, difficulty_config):
         super().__init__(x, speed)
         self.width = 40
         self.coil_y = random.randint(150, HEIGHT - 150)
         self.spark_counter = 0
-        self.spark_particles = []
+        # Every spark lives 20 frames, so they die in the order they were
+        # spawned and can be dropped from the front
+        self.spark_particles = deque()
         self.block_size = 4
         
         difficulty_params = calculate_difficulty_params(score, difficulty_config)
         self.collision_radius = 30 + int((250 - difficulty_params['gap']) * 0.1)
+        self._radius_sq = self.collision_radius * self.collision_radius
     
     def update(self):
         result = super().update()
@@ -1270,27 +1646,41 @@ class ElectricCoilObstacle(Obstacle):
                 'life': 20
             })
         
-        for particle in self.spark_particles[:]:
+        sparks = self.spark_particles
+        for particle in sparks:
             particle['x'] += particle['vx']
             particle['y'] += particle['vy']
             particle['life'] -= 1
-            if particle['life'] <= 0:
-                self.spark_particles.remove(particle)
+        while sparks and sparks[0]['life'] <= 0:
+            sparks.popleft()
         
         return result
     
+    def span(self):
+        # Sparks keep the screen x they were spawned at rather than scrolling
+        # with the coil, so late in their life they trail well right of it
+        left, right = super().span()
+        for particle in self.spark_particles:
+            px = particle['x']
+            if px - 3 < left:
+                left = px - 3
+            elif px + 3 > right:
+                right = px + 3
+        return left, right
+    
     def draw(self):
         center = (self.x + 20, self.coil_y)
         
-        for angle in range(0, 360, 15):
-            rad = math.radians(angle)
-            for radius in [10, 15, 20]:
-                x = center[0] + int(math.cos(rad) * radius)
-                y = center[1] + int(math.sin(rad) * radius)
-                x = (x // self.block_size) * self.block_size
-                y = (y // self.block_size) * self.block_size
-                color = TOXIC_GREEN if radius == 20 else DARK_GRAY
-                pygame.draw.rect(screen, color, (x, y, self.block_size, self.block_size))
+        bs = self.block_size
+        outer, inner = block_sprite(TOXIC_GREEN, bs), block_sprite(DARK_GRAY, bs)
+        blocks = []
+        for dx, dy, radius in ring_offsets(15, (10, 15, 20)):
+            x = center[0] + dx
+            y = center[1] + dy
+            x = (x // bs) * bs
+            y = (y // bs) * bs
+            blocks.append((outer if radius == 20 else inner, (x, y)))
+        screen.blits(blocks, False)
         
         for i in range(3):
             angle = (self.spark_counter + i * 120) % 360
@@ -1298,19 +1688,28 @@ class ElectricCoilObstacle(Obstacle):
             end_y = center[1] + math.sin(math.radians(angle)) * 25
             pygame.draw.line(screen, TOXIC_GREEN, center, (end_x, end_y), 2)
         
+        spark_dots = self._spark_dots
         for particle in self.spark_particles:
-            alpha = int(255 * (particle['life'] / 20))
-            size = max(1, int(3 * (particle['life'] / 20)))
-            surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, (*TOXIC_GREEN, alpha), (size, size), size)
+            life = particle['life']
+            dot = spark_dots.get(life)
+            if dot is None:
+                alpha = int(255 * (life / 20))
+                size = max(1, int(3 * (life / 20)))
+                surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+                pygame.draw.circle(surf, rgba(TOXIC_GREEN, alpha), (size, size), size)
+                dot = spark_dots[life] = (surf.convert_alpha(), size)
+            surf, size = dot
             screen.blit(surf, (int(particle['x']) - size, int(particle['y']) - size))
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
         center = (self.x + 20, self.coil_y)
-        bird_center = (collision_rect.centerx, collision_rect.centery)
-        distance = math.sqrt((bird_center[0] - center[0])**2 + (bird_center[1] - center[1])**2)
-        return distance < self.collision_radius
+        dx = collision_rect.centerx - center[0]
+        # Horizontally out of reach; no need for the distance
+        if abs(dx) >= self.collision_radius:
+            return False
+        dy = collision_rect.centery - center[1]
+        return dx * dx + dy * dy < self._radius_sq
 
 class SpinningBladeObstacle(Obstacle):
     def __init__(self, x, speed, score, difficulty_config):
@@ -1323,38 +1722,45 @@ class SpinningBladeObstacle(Obstacle):
         
         difficulty_params = calculate_difficulty_params(score, difficulty_config)
         self.collision_radius = 35 + int((250 - difficulty_params['gap']) * 0.08)
+        self._radius_sq = self.collision_radius * self.collision_radius
     
     def draw(self):
         self.rotation += 8
         center = (self.x + 30, self.blade_y)
         
+        bs = self.block_size
+        small, large = block_sprite(DARK_GRAY, bs, BLOOD_RED), block_sprite(DARK_GRAY, bs * 2, BLOOD_RED)
+        blocks = []
+        cx, cy = center
+        append = blocks.append
         for i in range(4):
             angle = math.radians(self.rotation + i * 90)
+            cos_a, sin_a = math.cos(angle), math.sin(angle)
             
-            for dist in range(10, self.blade_length, self.block_size):
-                x = center[0] + math.cos(angle) * dist
-                y = center[1] + math.sin(angle) * dist
-                x = int(x // self.block_size) * self.block_size
-                y = int(y // self.block_size) * self.block_size
+            for dist in range(10, self.blade_length, bs):
+                x = cx + cos_a * dist
+                y = cy + sin_a * dist
+                x = int(x // bs) * bs
+                y = int(y // bs) * bs
                 
-                width = self.block_size * 2 if dist > 20 else self.block_size
-                pygame.draw.rect(screen, DARK_GRAY, (x, y, width, width))
-                pygame.draw.rect(screen, BLOOD_RED, (x, y, width, width), 1)
-        
-        for angle in range(0, 360, 30):
-            rad = math.radians(angle)
-            for radius in [6, 9, 12]:
-                x = center[0] + int(math.cos(rad) * radius)
-                y = center[1] + int(math.sin(rad) * radius)
-                pygame.draw.rect(screen, DARK_GRAY if radius < 12 else BLOOD_RED, 
-                               (x - 2, y - 2, 4, 4))
+                append((large if dist > 20 else small, (x, y)))
+        
+        hub, rim = block_sprite(DARK_GRAY, 4), block_sprite(BLOOD_RED, 4)
+        for dx, dy, radius in ring_offsets(30, (6, 9, 12)):
+            x = center[0] + dx
+            y = center[1] + dy
+            blocks.append((hub if radius < 12 else rim, (x - 2, y - 2)))
+        screen.blits(blocks, False)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
         center = (self.x + 30, self.blade_y)
-        bird_center = (collision_rect.centerx, collision_rect.centery)
-        distance = math.sqrt((bird_center[0] - center[0])**2 + (bird_center[1] - center[1])**2)
-        return distance < self.collision_radius
+        dx = collision_rect.centerx - center[0]
+        # Horizontally out of reach; no need for the distance
+        if abs(dx) >= self.collision_radius:
+            return False
+        dy = collision_rect.centery - center[1]
+        return dx * dx + dy * dy < self._radius_sq
 
 class BouncingBallObstacle(Obstacle):
     def __init__(self, x, speed, score, difficulty_config):
@@ -1368,6 +1774,7 @@ class BouncingBallObstacle(Obstacle):
         
         difficulty_params = calculate_difficulty_params(score, difficulty_config)
         self.collision_radius = self.radius + 10 + int((250 - difficulty_params['gap']) * 0.05)
+        self._radius_sq = self.collision_radius * self.collision_radius
     
     def update(self):
         result = super().update()
@@ -1380,30 +1787,41 @@ class BouncingBallObstacle(Obstacle):
         
         return result
     
+    def span(self):
+        # The spawner respaces self.x after construction but the ball keeps
+        # the x it was built with, so it can be hundreds of px from self.x
+        reach = self.collision_radius + 5
+        return self.ball_x - reach, self.ball_x + reach
+    
     def draw(self):
         center = (int(self.ball_x), int(self.ball_y))
         
-        for angle in range(0, 360, 10):
-            rad = math.radians(angle)
-            for radius in range(self.radius - 10, self.radius, 5):
-                x = center[0] + int(math.cos(rad) * radius)
-                y = center[1] + int(math.sin(rad) * radius)
-                x = (x // self.block_size) * self.block_size
-                y = (y // self.block_size) * self.block_size
-                color = TOXIC_GREEN if radius > self.radius - 5 else DARK_GRAY
-                pygame.draw.rect(screen, color, (x, y, self.block_size, self.block_size))
-        
+        bs = self.block_size
+        outer, inner = block_sprite(TOXIC_GREEN, bs), block_sprite(DARK_GRAY, bs)
+        blocks = []
+        for dx, dy, radius in ring_offsets(10, tuple(range(self.radius - 10, self.radius, 5))):
+            x = center[0] + dx
+            y = center[1] + dy
+            x = (x // bs) * bs
+            y = (y // bs) * bs
+            blocks.append((outer if radius > self.radius - 5 else inner, (x, y)))
+        screen.blits(blocks, False)
+        
+        spin = pygame.time.get_ticks() * 0.5
         for i in range(4):
-            angle = math.radians(pygame.time.get_ticks() * 0.5 + i * 90)
+            angle = math.radians(spin + i * 90)
             end_x = center[0] + math.cos(angle) * 10
             end_y = center[1] + math.sin(angle) * 10
             pygame.draw.line(screen, BLOOD_RED, center, (end_x, end_y), 2)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
-        bird_center = (collision_rect.centerx, collision_rect.centery)
-        distance = math.sqrt((bird_center[0] - self.ball_x)**2 + (bird_center[1] - self.ball_y)**2)
-        return distance < self.collision_radius
+        dx = collision_rect.centerx - self.ball_x
+        # Horizontally out of reach; no need for the distance
+        if abs(dx) >= self.collision_radius:
+            return False
+        dy = collision_rect.centery - self.ball_y
+        return dx * dx + dy * dy < self._radius_sq
 
 class PortalObstacle(Obstacle):
     def __init__(self, x, speed, score, difficulty_config):
@@ -1419,30 +1837,30 @@ class PortalObstacle(Obstacle):
     
     def draw(self):
         self.rotation += 3
+        bs = self.block_size
+        inner = block_sprite(DARK_GRAY, bs)
+        blocks = []
         
         top_y = max(50, int(self.portal_y - self.gap // 2))
         top_center = (self.x + 25, top_y)
-        for angle in range(0, 360, 20):
-            rad = math.radians(angle + self.rotation)
-            for radius in range(15, 30, 5):
-                x = top_center[0] + int(math.cos(rad) * radius)
-                y = top_center[1] + int(math.sin(rad) * radius)
-                x = (x // self.block_size) * self.block_size
-                y = (y // self.block_size) * self.block_size
-                color = PURPLE_MIST if radius > 20 else DARK_GRAY
-                pygame.draw.rect(screen, color, (x, y, self.block_size, self.block_size))
+        outer = block_sprite(PURPLE_MIST, bs)
+        for dx, dy, radius in ring_offsets(20, (15, 20, 25), self.rotation):
+            x = top_center[0] + dx
+            y = top_center[1] + dy
+            x = (x // bs) * bs
+            y = (y // bs) * bs
+            blocks.append((outer if radius > 20 else inner, (x, y)))
         
         bottom_y = min(HEIGHT - 50, int(self.portal_y + self.gap // 2))
         bottom_center = (self.x + 25, bottom_y)
-        for angle in range(0, 360, 20):
-            rad = math.radians(angle - self.rotation)
-            for radius in range(15, 30, 5):
-                x = bottom_center[0] + int(math.cos(rad) * radius)
-                y = bottom_center[1] + int(math.sin(rad) * radius)
-                x = (x // self.block_size) * self.block_size
-                y = (y // self.block_size) * self.block_size
-                color = BLOOD_RED if radius > 20 else DARK_GRAY
-                pygame.draw.rect(screen, color, (x, y, self.block_size, self.block_size))
+        outer = block_sprite(BLOOD_RED, bs)
+        for dx, dy, radius in ring_offsets(20, (15, 20, 25), -self.rotation):
+            x = bottom_center[0] + dx
+            y = bottom_center[1] + dy
+            x = (x // bs) * bs
+            y = (y // bs) * bs
+            blocks.append((outer if radius > 20 else inner, (x, y)))
+        screen.blits(blocks, False)
     
     def collide(self, bird):
         collision_rect = bird.get_collision_rect()
@@ -1463,9 +1881,12 @@ class Score:
     def add(self):
         self.value += 1
 
+    # Fixed position, shared by every Score (never mutated)
+    BOX_RECT = pygame.Rect(WIDTH // 2 - 70, 15, 140, 50)
+
     def draw(self):
-        box_rect = pygame.Rect(WIDTH // 2 - 70, 15, 140, 50)
-        pygame.draw.rect(screen, BLACK, box_rect)
+        box_rect = self.BOX_RECT
+        screen.fill(BLACK, box_rect)
         pygame.draw.rect(screen, BLOOD_RED, box_rect, 3)
         
         UITheme.draw_text(screen, str(self.value), WIDTH // 2, 40, 48, WHITE)
@@ -1473,6 +1894,58 @@ class Score:
 # ================= MAIN GAME =================
 class NoisyBird:
     loud = False
+    
+    # Menus and summaries are static apart from the atmosphere, so only
+    # gameplay runs at the full frame rate
+    FRAME_RATE = 60
+    MENU_FRAME_RATE = 30
+    FULL_RATE_STATES = frozenset({GameState.PLAYING, GameState.GAME_OVER})
+    
+    # Typed character -> character added to the username (letters and
+    # digits, upper-cased); one dict lookup per key press
+    USERNAME_KEYS = {c: c.upper() for c in string.ascii_letters + string.digits}
+    # Attempts are a single digit 1-9; other Unicode digits are refused
+    ATTEMPT_KEYS = frozenset('123456789')
+    
+    # Obstacle classes unlocked by score, highest tier first. Tuples built
+    # once, so spawning doesn't allocate a list per obstacle
+    OBSTACLE_POOLS = (
+        (20, (
+            GravePillarObstacle,
+            LaserGateObstacle,
+            ElectricCoilObstacle,
+            SpinningBladeObstacle,
+            BouncingBallObstacle,
+            PortalObstacle,
+            SkullTowerObstacle,      # NEW
+            CreepingVinesObstacle,   # NEW
+            FloatingEyeballObstacle, # NEW
+            PendulumAxeObstacle,     # NEW
+            CoffinObstacle           # NEW
+        )),
+        (15, (
+            GravePillarObstacle,
+            LaserGateObstacle,
+            ElectricCoilObstacle,
+            SpinningBladeObstacle,
+            BouncingBallObstacle,
+            PortalObstacle,
+            SkullTowerObstacle,      # NEW
+            FloatingEyeballObstacle  # NEW
+        )),
+        (10, (
+            GravePillarObstacle,
+            LaserGateObstacle,
+            ElectricCoilObstacle,
+            SpinningBladeObstacle,
+            SkullTowerObstacle       # NEW
+        )),
+        (5, (
+            GravePillarObstacle,
+            LaserGateObstacle,
+            SkullTowerObstacle       # NEW
+        )),
+    )
 
     def __init__(self):
         self.session_manager = GameSessionManager()
@@ -1485,19 +1958,77 @@ class NoisyBird:
         self.username_input = ""
         self.selected_difficulty_index = 1
         
+        # Per-player/per-attempt UI strings, formatted when the state that
+        # shows them is entered instead of on every frame
+        self._ui_text = {}
+        
         self.bird = None
         self.score = None
-        self.obstacles = []
+        self.obstacles = deque()
+        self._last_obstacle = None
         self.game_over_timer = 0
         self.current_difficulty_config = None
         self.current_difficulty_params = None
         
         self.horror_background = HorrorBackground()
-        self.fog_particles = [FogParticle() for _ in range(15)]
+        self.fog = FogSystem(15)
         self.bats = [Bat() for _ in range(5)]
         self.ghosts = [Ghost() for _ in range(3)]
         self.lightning = LightningFlash()
-        self.stars = [Star() for _ in range(30)]
+        self.stars = StarSystem(30)
+        
+        # Difficulties are static: names and the selection stats line
+        # are worked out once rather than per frame / per key press
+        self._difficulty_names = DifficultyManager.get_all_names()
+        self._difficulty_stats_text = [
+            f"Bird: {int(config.bird_scale * 100)}% | Speed: {config.obstacle_speed:.1f} | "
+            f"{'EASY MODE ON' if config.easy_mode else 'HARD FROM START'}"
+            for config in map(DifficultyManager.get_config, self._difficulty_names)
+        ]
+        
+        # UI boxes sit at fixed positions, so build their Rects once
+        self._setup_input_rect = pygame.Rect(WIDTH // 2 - 100, 280, 200, 50)
+        self._username_input_rect = pygame.Rect(WIDTH // 2 - 150, 280, 300, 50)
+        self._leaderboard_rect = pygame.Rect(WIDTH // 2 - 300, 120, 600, 400)
+        
+        # Session results don't change while they're on screen: the panel
+        # and its entries are rendered once per visit to that state
+        self._leaderboard_surface = None
+        self._difficulty_button_rects = [
+            pygame.Rect(WIDTH // 2 - 120, 200 + i * 70, 240, 55)
+            for i in range(len(self._difficulty_names))
+        ]
+        
+        # KEYDOWN handler per state, looked up once per event
+        self._key_handlers = {
+            GameState.SPLASH_SCREEN: self._on_key_splash,
+            GameState.SETUP_ATTEMPTS: self._on_key_setup_attempts,
+            GameState.USERNAME_INPUT: self._on_key_username_input,
+            GameState.DIFFICULTY_SELECT: self._on_key_difficulty_select,
+            GameState.WAITING: self._on_key_waiting,
+            GameState.PLAYING: self._on_key_playing,
+            GameState.GAME_OVER: self._on_key_game_over,
+            GameState.ATTEMPT_SUMMARY: self._on_key_attempt_summary,
+            GameState.SESSION_LEADERBOARD: self._on_key_session_leaderboard,
+        }
+        
+        # Per-state frame body (PLAYING/GAME_OVER include their update step)
+        self._draw_table = {
+            GameState.SPLASH_SCREEN: self.draw_splash_screen,
+            GameState.SETUP_ATTEMPTS: self.draw_setup_attempts,
+            GameState.USERNAME_INPUT: self.draw_username_input,
+            GameState.DIFFICULTY_SELECT: self.draw_difficulty_select,
+            GameState.WAITING: self.draw_waiting,
+            GameState.PLAYING: self._draw_playing,
+            GameState.GAME_OVER: self._draw_game_over,
+            GameState.ATTEMPT_SUMMARY: self.draw_attempt_summary,
+            GameState.SESSION_LEADERBOARD: self.draw_session_leaderboard,
+        }
+        
+        # Only keys and quit are handled; don't let SDL queue mouse motion
+        # and the rest just to be discarded
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.KEYDOWN, pygame.QUIT])
         
         try:
             self.logo = pygame.image.load("images/logoexe.png").convert_alpha()
@@ -1518,12 +2049,20 @@ class NoisyBird:
             speed = difficulty_params['speed']
             h_dist = difficulty_params['horizontal_distance']
             
-            self.obstacles = [
+            # Obstacles scroll off the left edge in spawn order, so a deque
+            # lets the off-screen ones be dropped from the front
+            self.obstacles = deque([
                 GravePillarObstacle(WIDTH + 200, speed, 0, self.current_difficulty_config),
                 GravePillarObstacle(WIDTH + 200 + h_dist, speed, 0, self.current_difficulty_config)
-            ]
+            ])
+            # New obstacles always spawn behind the newest one, so it stays
+            # the rightmost; spacing reads its x instead of scanning the list
+            self._last_obstacle = self.obstacles[-1]
             self.game_over_timer = 0
             self.current_difficulty_params = difficulty_params
+            
+            self._ui_text['waiting_player'] = f"{player.username} | {player.difficulty}"
+            self._ui_text['waiting_attempt'] = f"Attempt {player.current_attempt + 1}/{player.max_attempts}"
 
     def spawn_obstacle(self, score_value):
         """Spawn obstacles with dynamic difficulty scaling and NEW obstacles"""
@@ -1533,56 +2072,20 @@ class NoisyBird:
         self.current_difficulty_params = difficulty_params
         
         # Progressive obstacle variety with NEW obstacles
-        if score_value >= 20:
-            obstacle_class = random.choice([
-                GravePillarObstacle,
-                LaserGateObstacle,
-                ElectricCoilObstacle,
-                SpinningBladeObstacle,
-                BouncingBallObstacle,
-                PortalObstacle,
-                SkullTowerObstacle,      # NEW
-                CreepingVinesObstacle,   # NEW
-                FloatingEyeballObstacle, # NEW
-                PendulumAxeObstacle,     # NEW
-                CoffinObstacle           # NEW
-            ])
-        elif score_value >= 15:
-            obstacle_class = random.choice([
-                GravePillarObstacle,
-                LaserGateObstacle,
-                ElectricCoilObstacle,
-                SpinningBladeObstacle,
-                BouncingBallObstacle,
-                PortalObstacle,
-                SkullTowerObstacle,      # NEW
-                FloatingEyeballObstacle  # NEW
-            ])
-        elif score_value >= 10:
-            obstacle_class = random.choice([
-                GravePillarObstacle,
-                LaserGateObstacle,
-                ElectricCoilObstacle,
-                SpinningBladeObstacle,
-                SkullTowerObstacle       # NEW
-            ])
-        elif score_value >= 5:
-            obstacle_class = random.choice([
-                GravePillarObstacle,
-                LaserGateObstacle,
-                SkullTowerObstacle       # NEW
-            ])
+        for min_score, pool in self.OBSTACLE_POOLS:
+            if score_value >= min_score:
+                obstacle_class = random.choice(pool)
+                break
         else:
             obstacle_class = GravePillarObstacle
         
         return obstacle_class(WIDTH + 100, speed, score_value, self.current_difficulty_config)
 
-    def draw_button(self, text, x, y, width, height, selected=False):
-        rect = pygame.Rect(x, y, width, height)
+    def draw_button(self, text, rect, selected=False):
         color = PURPLE_MIST if selected else DARK_GRAY
         border_color = BLOOD_RED if selected else PURPLE
         
-        pygame.draw.rect(screen, color, rect)
+        screen.fill(color, rect)
         pygame.draw.rect(screen, border_color, rect, 3)
         
         UITheme.draw_text(screen, text, rect.centerx, rect.centery, 32, WHITE)
@@ -1608,8 +2111,8 @@ class NoisyBird:
         UITheme.draw_text(screen, "WELCOME ", WIDTH // 2, 150, 64, BLOOD_RED, horror_style='dripping')
         UITheme.draw_text(screen, "HOW MANY ATTEMPTS PER PLAYER?", WIDTH // 2, 230, 36, TOXIC_GREEN, horror_style='shaky')
         
-        input_rect = pygame.Rect(WIDTH // 2 - 100, 280, 200, 50)
-        pygame.draw.rect(screen, BLACK, input_rect)
+        input_rect = self._setup_input_rect
+        screen.fill(BLACK, input_rect)
         pygame.draw.rect(screen, BLOOD_RED, input_rect, 3)
         
         display_text = self.attempts_input + "_" if self.attempts_input else "3_"
@@ -1618,20 +2121,23 @@ class NoisyBird:
         UITheme.draw_text(screen, "Press ENTER to continue", WIDTH // 2, 380, 24, GRAY)
         UITheme.draw_text(screen, "(Enter number 1-9, default is 3)", WIDTH // 2, 410, 20, GRAY)
 
-    def draw_username_input(self):
+    def _enter_username_input(self):
         player = self.session_manager.get_current_player()
         player_num = self.session_manager.current_player_index + 1
         
         if player and player.current_attempt > 0:
-            UITheme.draw_text(screen, f"{player.username} - ATTEMPT {player.current_attempt + 1}", 
-                            WIDTH // 2, 150, 48, BLOOD_RED, horror_style='jagged')
+            self._ui_text['username_title'] = f"{player.username} - ATTEMPT {player.current_attempt + 1}"
         else:
-            UITheme.draw_text(screen, f"PLAYER {player_num}", WIDTH // 2, 150, 48, BLOOD_RED, horror_style='jagged')
+            self._ui_text['username_title'] = f"PLAYER {player_num}"
+        self.state = GameState.USERNAME_INPUT
+
+    def draw_username_input(self):
+        UITheme.draw_text(screen, self._ui_text['username_title'], WIDTH // 2, 150, 48, BLOOD_RED, horror_style='jagged')
         
         UITheme.draw_text(screen, "ENTER USERNAME", WIDTH // 2, 230, 36, TOXIC_GREEN, horror_style='shaky')
         
-        input_rect = pygame.Rect(WIDTH // 2 - 150, 280, 300, 50)
-        pygame.draw.rect(screen, BLACK, input_rect)
+        input_rect = self._username_input_rect
+        screen.fill(BLACK, input_rect)
         pygame.draw.rect(screen, BLOOD_RED, input_rect, 3)
         
         UITheme.draw_text(screen, self.username_input + "_", WIDTH // 2, 305, 36, WHITE)
@@ -1640,23 +2146,18 @@ class NoisyBird:
         UITheme.draw_text(screen, "(Max 10 characters)", WIDTH // 2, 410, 20, GRAY)
 
     def draw_difficulty_select(self):
-        player = self.session_manager.get_current_player()
-        UITheme.draw_text(screen, f"{player.username} - SELECT DIFFICULTY", WIDTH // 2, 120, 42, BLOOD_RED, horror_style='cracked')
+        UITheme.draw_text(screen, self._ui_text['difficulty_title'], WIDTH // 2, 120, 42, BLOOD_RED, horror_style='cracked')
         
-        difficulties = DifficultyManager.get_all_names()
         y_pos = 200
         
-        for i, diff in enumerate(difficulties):
-            config = DifficultyManager.get_config(diff)
+        for i, diff in enumerate(self._difficulty_names):
             selected = i == self.selected_difficulty_index
             
-            self.draw_button(diff, WIDTH // 2 - 120, y_pos + i * 70, 240, 55, selected)
+            self.draw_button(diff, self._difficulty_button_rects[i], selected)
             
             if selected:
-                # Show easy mode status
-                easy_status = "EASY MODE ON" if config.easy_mode else "HARD FROM START"
-                stats = f"Bird: {int(config.bird_scale * 100)}% | Speed: {config.obstacle_speed:.1f} | {easy_status}"
-                UITheme.draw_text(screen, stats, WIDTH // 2, y_pos + i * 70 + 75, 16, GRAY)
+                # Show bird size, speed and easy mode status
+                UITheme.draw_text(screen, self._difficulty_stats_text[i], WIDTH // 2, y_pos + i * 70 + 75, 16, GRAY)
         
         UITheme.draw_text(screen, "Use UP/DOWN arrows, ENTER to continue", WIDTH // 2, 530, 24, GRAY)
 
@@ -1664,256 +2165,309 @@ class NoisyBird:
         if self.bird:
             self.bird.draw()
         
-        player = self.session_manager.get_current_player()
-        attempt_text = f"Attempt {player.current_attempt + 1}/{player.max_attempts}"
+        ui_text = self._ui_text
         
         UITheme.draw_text(screen, "SCREAMING FLAPPY BIRD", WIDTH // 2, 180, 56, BLOOD_RED, horror_style='dripping')
         UITheme.draw_text(screen, "MAKE NOISE TO FLY", WIDTH // 2, 250, 42, TOXIC_GREEN, horror_style='shaky')
-        UITheme.draw_text(screen, f"{player.username} | {player.difficulty}", WIDTH // 2, 300, 28, GHOST_WHITE)
-        UITheme.draw_text(screen, attempt_text, WIDTH // 2, 330, 24, GRAY)
+        UITheme.draw_text(screen, ui_text['waiting_player'], WIDTH // 2, 300, 28, GHOST_WHITE)
+        UITheme.draw_text(screen, ui_text['waiting_attempt'], WIDTH // 2, 330, 24, GRAY)
         UITheme.draw_text(screen, "Press SPACE to start", WIDTH // 2, 380, 28, WHITE)
 
-    def draw_attempt_summary(self):
+    def _enter_attempt_summary(self):
         player = self.session_manager.get_current_player()
         remaining = player.get_remaining_attempts()
+        ui_text = self._ui_text
         
-        UITheme.draw_text(screen, f"Score: {self.score.value}", WIDTH // 2, 200, 56, WHITE, horror_style='dripping')
-        UITheme.draw_text(screen, f"{player.username}", WIDTH // 2, 260, 36, TOXIC_GREEN, horror_style='shaky')
+        ui_text['summary_score'] = f"Score: {self.score.value}"
+        ui_text['summary_player'] = f"{player.username}"
         
         if remaining > 0:
-            UITheme.draw_text(screen, f"{remaining} Attempt(s) Remaining", WIDTH // 2, 320, 32, BLOOD_RED)
-            UITheme.draw_text(screen, "Press SPACE to continue", WIDTH // 2, 400, 28, WHITE)
+            ui_text['summary_status'] = f"{remaining} Attempt(s) Remaining"
+            ui_text['summary_prompt'] = "Press SPACE to continue"
         else:
-            UITheme.draw_text(screen, "All attempts used!", WIDTH // 2, 320, 32, BLOOD_RED)
+            ui_text['summary_status'] = "All attempts used!"
             
             if not self.session_manager.all_players_finished():
-                UITheme.draw_text(screen, "Press SPACE for next player", WIDTH // 2, 400, 28, WHITE)
+                ui_text['summary_prompt'] = "Press SPACE for next player"
             else:
-                UITheme.draw_text(screen, "Press SPACE for final results", WIDTH // 2, 400, 28, WHITE)
+                ui_text['summary_prompt'] = "Press SPACE for final results"
+        self.state = GameState.ATTEMPT_SUMMARY
 
-    def draw_session_leaderboard(self):
-        UITheme.draw_text(screen, "SESSION RESULTS", WIDTH // 2, 60, 48, BLOOD_RED, horror_style='cracked')
-        
-        board_rect = pygame.Rect(WIDTH // 2 - 300, 120, 600, 400)
-        pygame.draw.rect(screen, BLACK, board_rect)
-        pygame.draw.rect(screen, BLOOD_RED, board_rect, 3)
+    def draw_attempt_summary(self):
+        ui_text = self._ui_text
+        UITheme.draw_text(screen, ui_text['summary_score'], WIDTH // 2, 200, 56, WHITE, horror_style='dripping')
+        UITheme.draw_text(screen, ui_text['summary_player'], WIDTH // 2, 260, 36, TOXIC_GREEN, horror_style='shaky')
+        UITheme.draw_text(screen, ui_text['summary_status'], WIDTH // 2, 320, 32, BLOOD_RED)
+        UITheme.draw_text(screen, ui_text['summary_prompt'], WIDTH // 2, 400, 28, WHITE)
+
+    def _render_session_leaderboard(self):
+        """Render the results panel and its entries onto one surface"""
+        board_rect = self._leaderboard_rect
+        # Reaches to the bottom of the screen: entries past the fifth
+        # run below the panel, as they always have
+        surface = pygame.Surface((board_rect.width, HEIGHT - board_rect.top), pygame.SRCALPHA)
+        panel = board_rect.move(-board_rect.left, -board_rect.top)
+        surface.fill(BLACK, panel)
+        pygame.draw.rect(surface, BLOOD_RED, panel, 3)
         
         leaderboard = self.session_manager.get_session_leaderboard()
         
-        y = 150
+        # Entry positions below are in screen coordinates
+        left = WIDTH // 2 - board_rect.left
+        y = 150 - board_rect.top
         for i, entry in enumerate(leaderboard):
             rank_color = [TOXIC_GREEN, PURPLE_MIST, BLOOD_RED, WHITE, GRAY][min(i, 4)]
             rank_text = f"{i+1}. {entry['username'][:10]}"
             score_text = f"{entry['best_score']} ({entry['difficulty'][:3]})"
             
-            UITheme.draw_text(screen, rank_text, WIDTH // 2 - 200, y, 28, rank_color, center=False)
-            UITheme.draw_text(screen, score_text, WIDTH // 2 + 150, y, 28, WHITE, center=False)
+            UITheme.draw_text(surface, rank_text, left - 200, y, 28, rank_color, center=False)
+            UITheme.draw_text(surface, score_text, left + 150, y, 28, WHITE, center=False)
             
             all_scores = " | ".join(str(s) for s in entry['all_scores'])
-            UITheme.draw_text(screen, f"Scores: {all_scores}", WIDTH // 2 - 200, y + 25, 18, GRAY, center=False)
+            UITheme.draw_text(surface, f"Scores: {all_scores}", left - 200, y + 25, 18, GRAY, center=False)
             
             y += 70
         
+        return surface.convert_alpha()
+
+    def draw_session_leaderboard(self):
+        UITheme.draw_text(screen, "SESSION RESULTS", WIDTH // 2, 60, 48, BLOOD_RED, horror_style='cracked')
+        
+        if self._leaderboard_surface is None:
+            self._leaderboard_surface = self._render_session_leaderboard()
+        screen.blit(self._leaderboard_surface, self._leaderboard_rect.topleft)
+        
         UITheme.draw_text(screen, "Press SPACE to start new session", WIDTH // 2, 550, 24, GRAY)
 
+    def _draw_playing(self):
+        bird = self.bird
+        score = self.score
+        obstacles = self.obstacles
+        
+        if NoisyBird.loud:
+            bird.flap()
+        
+        bird.update()
+        bird_rect = bird.get_collision_rect()
+        
+        # Obstacles left of the bird are already scored, so only the
+        # next one or two still need the passed_bird check
+        spawned = []
+        for obs in obstacles:
+            # Move first so an obstacle leaving the screen this frame
+            # isn't drawn one last time
+            offscreen = obs.update()
+            if not obs.scored and obs.passed_bird(bird):
+                score.add()
+                
+                # spawn_obstacle looks up this score's parameters and
+                # keeps them, so the spacing comes from the same dict
+                new_obstacle = self.spawn_obstacle(score.value)
+                h_distance = self.current_difficulty_params['horizontal_distance']
+                
+                if obstacles:
+                    new_obstacle.x = self._last_obstacle.x + h_distance
+                
+                # A deque can't grow while it is being iterated
+                spawned.append(new_obstacle)
+                self._last_obstacle = new_obstacle
+            
+            # Only the one or two obstacles level with the bird get the
+            # full collide check
+            if obs.near(bird_rect) and obs.collide(bird):
+                self._enter_game_over()
+            # Spawned obstacles wait off the right edge; skip their draw
+            # calls until they scroll in
+            if not offscreen and obs.visible():
+                obs.draw()
+        
+        while obstacles and obstacles[0].x < -150:
+            obstacles.popleft()
+        obstacles.extend(spawned)
+        
+        if bird.hit_ground():
+            self._enter_game_over()
+        
+        bird.draw()
+        score.draw()
+
+    def _enter_game_over(self):
+        if self.bird.die_sound:
+            self.bird.die_sound.play()
+        self._ui_text['game_over_score'] = f"Score: {self.score.value}"
+        self.state = GameState.GAME_OVER
+        self.game_over_timer = 0
+
+    def _draw_game_over(self):
+        self.game_over_timer += 1
+        
+        self.bird.draw()
+        for obs in self.obstacles:
+            if obs.visible():
+                obs.draw()
+        self.score.draw()
+        
+        UITheme.draw_text(screen, "GAME OVER", WIDTH // 2, 220, 64, BLOOD_RED, horror_style='dripping')
+        UITheme.draw_text(screen, self._ui_text['game_over_score'], WIDTH // 2, 300, 42, WHITE)
+        
+        if self.game_over_timer > 40:
+            UITheme.draw_text(screen, "Press SPACE to continue", WIDTH // 2, 400, 28, GRAY)
+
+    def _on_key_splash(self, event):
+        if event.key == pygame.K_RETURN:
+            self.state = GameState.SETUP_ATTEMPTS
+
+    def _on_key_setup_attempts(self, event):
+        if event.key == pygame.K_RETURN:
+            # Key presses only ever leave one digit from ATTEMPT_KEYS here
+            attempts = int(self.attempts_input) if self.attempts_input else 3
+            self.session_manager.start_new_session(attempts)
+            self._enter_username_input()
+        elif event.key == pygame.K_BACKSPACE:
+            self.attempts_input = self.attempts_input[:-1]
+        elif event.unicode in self.ATTEMPT_KEYS and not self.attempts_input:
+            self.attempts_input += event.unicode
+
+    def _on_key_username_input(self, event):
+        if event.key == pygame.K_RETURN and len(self.username_input) > 0:
+            player = self.session_manager.get_current_player()
+            if not player or player.is_complete:
+                self.session_manager.add_player(self.username_input)
+                player = self.session_manager.get_current_player()
+            
+            self.username_input = ""
+            self._ui_text['difficulty_title'] = f"{player.username} - SELECT DIFFICULTY"
+            self.state = GameState.DIFFICULTY_SELECT
+        elif event.key == pygame.K_BACKSPACE:
+            self.username_input = self.username_input[:-1]
+        elif len(self.username_input) < 10:
+            char = self.USERNAME_KEYS.get(event.unicode)
+            if char:
+                self.username_input += char
+
+    def _on_key_difficulty_select(self, event):
+        difficulties = self._difficulty_names
+        if event.key == pygame.K_UP:
+            self.selected_difficulty_index = max(0, self.selected_difficulty_index - 1)
+        elif event.key == pygame.K_DOWN:
+            self.selected_difficulty_index = min(len(difficulties) - 1, self.selected_difficulty_index + 1)
+        elif event.key == pygame.K_RETURN:
+            player = self.session_manager.get_current_player()
+            player.difficulty = difficulties[self.selected_difficulty_index]
+            self.reset_game()
+            self.state = GameState.WAITING
+
+    def _on_key_waiting(self, event):
+        if event.key == pygame.K_SPACE:
+            self.state = GameState.PLAYING
+
+    def _on_key_playing(self, event):
+        pass
+
+    def _on_key_game_over(self, event):
+        if self.game_over_timer > 40:
+            if event.key == pygame.K_SPACE:
+                player = self.session_manager.get_current_player()
+                player.record_score(self.score.value)
+                self.leaderboard_manager.add_score(
+                    player.username, 
+                    self.score.value, 
+                    player.difficulty
+                )
+                self._enter_attempt_summary()
+
+    def _on_key_attempt_summary(self, event):
+        if event.key == pygame.K_SPACE:
+            player = self.session_manager.get_current_player()
+            
+            if player.get_remaining_attempts() > 0:
+                self.reset_game()
+                self.state = GameState.WAITING
+            elif not self.session_manager.all_players_finished():
+                self.session_manager.move_to_next_player()
+                self._enter_username_input()
+            else:
+                self.state = GameState.SESSION_LEADERBOARD
+
+    def _on_key_session_leaderboard(self, event):
+        if event.key == pygame.K_SPACE:
+            self.attempts_input = ""
+            self._leaderboard_surface = None
+            self.state = GameState.SPLASH_SCREEN
+
     def play(self):
+        # The loop runs for the whole session; bind what it touches every
+        # frame once
+        background = self.horror_background
+        fog, stars, ghosts, bats = self.fog, self.stars, self.ghosts, self.bats
+        lightning = self.lightning
+        text_tick = HorrorFontRenderer.tick
+        key_handlers, draw_table = self._key_handlers, self._draw_table
+        get_events, flip = pygame.event.get, pygame.display.flip
+        QUIT, KEYDOWN = pygame.QUIT, pygame.KEYDOWN
+        
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in get_events():
+                if event.type == QUIT:
                     pygame.quit()
                     sys.exit()
                 
-                if event.type == pygame.KEYDOWN:
-                    if self.state == GameState.SPLASH_SCREEN:
-                        if event.key == pygame.K_RETURN:
-                            self.state = GameState.SETUP_ATTEMPTS
-                    
-                    elif self.state == GameState.SETUP_ATTEMPTS:
-                        if event.key == pygame.K_RETURN:
-                            attempts = int(self.attempts_input) if self.attempts_input.isdigit() else 3
-                            attempts = max(1, min(9, attempts))
-                            self.session_manager.start_new_session(attempts)
-                            self.state = GameState.USERNAME_INPUT
-                        elif event.key == pygame.K_BACKSPACE:
-                            self.attempts_input = self.attempts_input[:-1]
-                        elif event.unicode.isdigit() and len(self.attempts_input) < 1:
-                            self.attempts_input += event.unicode
-                    
-                    elif self.state == GameState.USERNAME_INPUT:
-                        if event.key == pygame.K_RETURN and len(self.username_input) > 0:
-                            player = self.session_manager.get_current_player()
-                            if not player or player.is_complete:
-                                self.session_manager.add_player(self.username_input)
-                                player = self.session_manager.get_current_player()
-                            
-                            self.username_input = ""
-                            self.state = GameState.DIFFICULTY_SELECT
-                        elif event.key == pygame.K_BACKSPACE:
-                            self.username_input = self.username_input[:-1]
-                        elif len(self.username_input) < 10 and event.unicode.isalnum():
-                            self.username_input += event.unicode.upper()
-                    
-                    elif self.state == GameState.DIFFICULTY_SELECT:
-                        difficulties = DifficultyManager.get_all_names()
-                        if event.key == pygame.K_UP:
-                            self.selected_difficulty_index = max(0, self.selected_difficulty_index - 1)
-                        elif event.key == pygame.K_DOWN:
-                            self.selected_difficulty_index = min(len(difficulties) - 1, self.selected_difficulty_index + 1)
-                        elif event.key == pygame.K_RETURN:
-                            player = self.session_manager.get_current_player()
-                            player.difficulty = difficulties[self.selected_difficulty_index]
-                            self.reset_game()
-                            self.state = GameState.WAITING
-                    
-                    elif self.state == GameState.WAITING:
-                        if event.key == pygame.K_SPACE:
-                            self.state = GameState.PLAYING
-                    
-                    elif self.state == GameState.GAME_OVER:
-                        if self.game_over_timer > 40:
-                            if event.key == pygame.K_SPACE:
-                                player = self.session_manager.get_current_player()
-                                player.record_score(self.score.value)
-                                self.leaderboard_manager.add_score(
-                                    player.username, 
-                                    self.score.value, 
-                                    player.difficulty
-                                )
-                                self.state = GameState.ATTEMPT_SUMMARY
-                    
-                    elif self.state == GameState.ATTEMPT_SUMMARY:
-                        if event.key == pygame.K_SPACE:
-                            player = self.session_manager.get_current_player()
-                            
-                            if player.get_remaining_attempts() > 0:
-                                self.reset_game()
-                                self.state = GameState.WAITING
-                            elif not self.session_manager.all_players_finished():
-                                self.session_manager.move_to_next_player()
-                                self.state = GameState.USERNAME_INPUT
-                            else:
-                                self.state = GameState.SESSION_LEADERBOARD
-                    
-                    elif self.state == GameState.SESSION_LEADERBOARD:
-                        if event.key == pygame.K_SPACE:
-                            self.attempts_input = ""
-                            self.state = GameState.SPLASH_SCREEN
-
-            screen.fill(BLACK)
-            
-            self.horror_background.draw()
-            
-            for fog in self.fog_particles:
+                if event.type == KEYDOWN:
+                    key_handlers[self.state](event)
+
+            fps = self.FRAME_RATE if self.state in self.FULL_RATE_STATES else self.MENU_FRAME_RATE
+            # At the menu rate the atmosphere steps more than once per frame
+            # so it drifts, pulses and jitters (and lightning strikes) at the
+            # same speed
+            steps = self.FRAME_RATE // fps
+
+            for _ in range(steps):
+                background.update()
+                text_tick()
                 fog.update()
-                fog.draw()
-            
-            for star in self.stars:
-                star.update()
-                star.draw()
+                stars.update()
+                for ghost in ghosts:
+                    ghost.update()
+                for bat in bats:
+                    bat.update()
             
-            for ghost in self.ghosts:
-                ghost.update()
+            # The opaque static background covers the whole screen, so no
+            # separate clear pass is needed
+            background.draw()
+            fog.draw()
+            stars.draw()
+            for ghost in ghosts:
                 ghost.draw()
-            
-            for bat in self.bats:
-                bat.update()
+            for bat in bats:
                 bat.draw()
 
-            if self.state == GameState.SPLASH_SCREEN:
-                self.draw_splash_screen()
-            
-            elif self.state == GameState.SETUP_ATTEMPTS:
-                self.draw_setup_attempts()
-            
-            elif self.state == GameState.USERNAME_INPUT:
-                self.draw_username_input()
-            
-            elif self.state == GameState.DIFFICULTY_SELECT:
-                self.draw_difficulty_select()
-            
-            elif self.state == GameState.WAITING:
-                self.draw_waiting()
-            
-            elif self.state == GameState.PLAYING:
-                if NoisyBird.loud:
-                    self.bird.flap()
-                
-                self.bird.update()
-                
-                obstacles_to_remove = []
-                for i, obs in enumerate(self.obstacles):
-                    obs.draw()
-                    if obs.passed_bird(self.bird):
-                        self.score.add()
-                        
-                        difficulty_params = calculate_difficulty_params(self.score.value, self.current_difficulty_config)
-                        h_distance = difficulty_params['horizontal_distance']
-                        
-                        new_obstacle = self.spawn_obstacle(self.score.value)
-                        
-                        if self.obstacles:
-                            last_x = max(o.x for o in self.obstacles)
-                            new_obstacle.x = last_x + h_distance
-                        
-                        self.obstacles.append(new_obstacle)
-                    
-                    if obs.update():
-                        obstacles_to_remove.append(i)
-                    if obs.collide(self.bird):
-                        if self.bird.die_sound:
-                            self.bird.die_sound.play()
-                        self.state = GameState.GAME_OVER
-                        self.game_over_timer = 0
-                
-                for i in reversed(obstacles_to_remove):
-                    self.obstacles.pop(i)
-                
-                if self.bird.hit_ground():
-                    if self.bird.die_sound:
-                        self.bird.die_sound.play()
-                    self.state = GameState.GAME_OVER
-                    self.game_over_timer = 0
-                
-                self.bird.draw()
-                self.score.draw()
-            
-            elif self.state == GameState.GAME_OVER:
-                self.game_over_timer += 1
-                
-                self.bird.draw()
-                for obs in self.obstacles:
-                    obs.draw()
-                self.score.draw()
-                
-                UITheme.draw_text(screen, "GAME OVER", WIDTH // 2, 220, 64, BLOOD_RED, horror_style='dripping')
-                UITheme.draw_text(screen, f"Score: {self.score.value}", WIDTH // 2, 300, 42, WHITE)
-                
-                if self.game_over_timer > 40:
-                    UITheme.draw_text(screen, "Press SPACE to continue", WIDTH // 2, 400, 28, GRAY)
-            
-            elif self.state == GameState.ATTEMPT_SUMMARY:
-                self.draw_attempt_summary()
-            
-            elif self.state == GameState.SESSION_LEADERBOARD:
-                self.draw_session_leaderboard()
+            draw_table[self.state]()
 
-            self.lightning.update()
-            self.lightning.draw()
+            for _ in range(steps):
+                lightning.update()
+            lightning.draw()
 
-            pygame.display.flip()
-            clock.tick(60)
+            flip()
+            clock.tick(fps)
 
 # ================= ENTRY =================
 def main():
     try:
+        # Loud when the block's RMS exceeds 0.02; compared as mean energy so
+        # the audio thread skips the square root
+        loud_energy = 0.02 * 0.02
+        
         def sound_callback(indata, frames, time, status):
-            volume = np.sqrt(np.mean(indata**2))
-            NoisyBird.loud = volume > 0.02
+            # Energy via a dot product over the mono channel view: no
+            # temporary arrays on the audio thread
+            samples = indata[:, 0]
+            NoisyBird.loud = np.dot(samples, samples) > loud_energy * frames
         
         stream = sd.InputStream(
             channels=1,
             samplerate=44100,
             blocksize=1024,
+            dtype='float32',
             callback=sound_callback
         )
         stream.start()
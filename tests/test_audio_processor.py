@@ -0,0 +1,165 @@
+"""
+Tests for the audio callback -> worker frame hand-off and loud detection
+
+Run from the repository root:
+    python -m unittest discover -s tests
+"""
+
+import contextlib
+import io
+import unittest
+
+import numpy as np
+
+try:
+    from audio_processor import AdvancedAudioProcessor
+except (ImportError, OSError) as exc:  # sounddevice needs the PortAudio library
+    raise unittest.SkipTest(f"audio stack unavailable: {exc}")
+
+
+BLOCKSIZE = 2048
+SAMPLERATE = 44100
+
+
+def make_processor(**settings):
+    with contextlib.redirect_stdout(io.StringIO()):
+        processor = AdvancedAudioProcessor(samplerate=SAMPLERATE, blocksize=BLOCKSIZE)
+    for name, value in settings.items():
+        setattr(processor, name, value)
+    return processor
+
+
+def loud_flags(processor, blocks):
+    """Feed blocks through the callback and worker; loud state after each"""
+    flags = []
+    for block in blocks:
+        processor._audio_callback(block.reshape(-1, 1), BLOCKSIZE, None, None)
+        processor._process_pending()
+        flags.append(processor.is_loud())
+    return flags
+
+
+def tone_over_hum(tone, hum=0.01, quiet_blocks=40, tone_blocks=80, freq=1500, seed=0):
+    """A steady 100 Hz hum (which sets the noise floor), then a held tone on top"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(BLOCKSIZE) / SAMPLERATE
+    blocks = []
+    for i in range(quiet_blocks + tone_blocks):
+        block = rng.normal(0, 0.0002, BLOCKSIZE) + hum * np.sin(2 * np.pi * 100 * t + i)
+        if i >= quiet_blocks:
+            block += tone * np.sin(2 * np.pi * freq * t + i)
+        blocks.append(block.astype(np.float32))
+    return blocks
+
+
+def tone_over_noise(tone, noise=0.002, quiet_blocks=40, tone_blocks=80, freq=1500, seed=0):
+    """Broadband noise (which sets the noise floor), then a held tone on top"""
+    rng = np.random.default_rng(seed)
+    t = np.arange(BLOCKSIZE) / SAMPLERATE
+    blocks = []
+    for i in range(quiet_blocks + tone_blocks):
+        block = rng.normal(0, noise, BLOCKSIZE)
+        if i >= quiet_blocks:
+            block += tone * np.sin(2 * np.pi * freq * t + i)
+        blocks.append(block.astype(np.float32))
+    return blocks
+
+
+class FramePoolTest(unittest.TestCase):
+    """Pooled frame buffers must never be reused while queued or in a batch"""
+
+    def setUp(self):
+        self.processor = make_processor()
+        self.pool_size = len(self.processor._free_frames)
+
+    def feed(self, value):
+        """Run the audio callback on a block filled with a marker value"""
+        block = np.full((BLOCKSIZE, 1), value, dtype=np.float32)
+        self.processor._audio_callback(block, BLOCKSIZE, None, None)
+
+    def queued_values(self):
+        return [float(frame[0]) for frame in self.processor._ring]
+
+    def test_stalled_worker_keeps_its_batch(self):
+        processor = self.processor
+        ring = processor._ring
+        process_audio = processor._process_audio
+        stalled_batches = []
+
+        def stalled_process_audio(frames):
+            if not stalled_batches:
+                expected = [frame.copy() for frame in frames]
+
+                # The worker is stuck on this batch while the callback keeps
+                # producing, enough to wrap the pool several times over
+                fed = range(100, 100 + 3 * self.pool_size)
+                for value in fed:
+                    self.feed(value)
+
+                for frame, before in zip(frames, expected):
+                    np.testing.assert_array_equal(frame, before)
+
+                # The ring still holds the newest frames, each intact
+                self.assertEqual(self.queued_values(),
+                                 [float(v) for v in fed[-ring.maxlen:]])
+                for frame in ring:
+                    self.assertTrue((frame == frame[0]).all())
+
+                stalled_batches.append(len(frames))
+            process_audio(frames)
+
+        processor._process_audio = stalled_process_audio
+
+        for value in range(processor.max_batch + 2):
+            self.feed(value)
+        processor._process_pending()
+
+        self.assertEqual(stalled_batches, [processor.max_batch])
+        self.assertEqual(len(ring), 0)
+        self.assertEqual(len(processor._free_frames), self.pool_size)
+
+    def test_full_ring_drops_oldest_and_recycles_its_buffer(self):
+        ring = self.processor._ring
+
+        for value in range(5 * self.pool_size):
+            self.feed(value)
+
+        self.assertEqual(self.queued_values(),
+                         [float(v) for v in range(5 * self.pool_size - ring.maxlen,
+                                                  5 * self.pool_size)])
+        self.assertEqual(len(self.processor._free_frames),
+                         self.pool_size - ring.maxlen)
+
+
+class LoudDetectionTest(unittest.TestCase):
+    """Decisions on held sounds that have no onset after their first block"""
+
+    def test_sustained_tone_near_noise_floor_is_loud(self):
+        # The tone lifts the block RMS to about 2.2x the hum's noise floor;
+        # rms + band + centroid must flag it on every block, onset or not
+        blocks = tone_over_hum(tone=0.02)
+        flags = loud_flags(make_processor(), blocks)
+
+        self.assertFalse(any(flags[:40]))
+        self.assertTrue(all(flags[41:]))
+
+    def test_faint_tone_in_broadband_noise_is_not_loud(self):
+        # Magnitude-weighted, the noise keeps the centroid above 5 kHz until
+        # the tone dominates it; a power-weighted centroid let these through
+        for tone in (0.004, 0.006, 0.03):
+            with self.subTest(tone=tone):
+                flags = loud_flags(make_processor(), tone_over_noise(tone))
+                self.assertFalse(any(flags))
+
+    def test_strong_tone_in_broadband_noise_is_loud(self):
+        flags = loud_flags(make_processor(), tone_over_noise(0.1))
+        self.assertFalse(any(flags[:40]))
+        self.assertTrue(all(flags[41:]))
+
+    def test_hum_alone_is_not_loud(self):
+        flags = loud_flags(make_processor(), tone_over_hum(tone=0.0))
+        self.assertFalse(any(flags))
+
+
+if __name__ == '__main__':
+    unittest.main()